@@ -1,6 +1,7 @@
 import typer
 
-from .main import mcp_server
+from .main import mcp_server, setup_logging
+from .services import vector_service
 
 cli = typer.Typer(
     name="novaport-mcp",
@@ -12,6 +13,10 @@ cli = typer.Typer(
 @cli.command(help="Starts the NovaPort-MCP server in STDIO mode (default command).")
 def start():
     """Start the server in STDIO mode, waiting for tool calls with a 'workspace_id'."""
+    setup_logging()
+    # Warm the embedding model while the transport comes up, so the first
+    # tool call that needs an embedding doesn't pay the model load.
+    vector_service.warmup_embedding_model()
     print("Starting NovaPort-MCP server in STDIO mode...")
     print("This server is multi-workspace capable.")
     print("Waiting for tool calls with a 'workspace_id' argument...")
@@ -21,7 +21,9 @@ def upsert_custom_data(
 ):
     """Create a new custom data entry, or update it if it already exists."""
     workspace_id = decode_workspace_id(workspace_id_b64)
-    return custom_data_service.upsert(db=db, workspace_id=workspace_id, data=data)
+    return custom_data_service.upsert(
+        db=db, workspace_id=workspace_id, **data.model_dump()
+    )
 
 
 @router.get("/{category}", response_model=List[cd_schema.CustomDataRead])
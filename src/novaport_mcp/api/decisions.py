@@ -25,7 +25,9 @@ def create_decision(
 ):
     """Log a new project or architectural decision."""
     workspace_id = decode_workspace_id(workspace_id_b64)
-    return decision_service.create(db=db, workspace_id=workspace_id, decision=decision)
+    return decision_service.create(
+        db=db, workspace_id=workspace_id, **decision.model_dump()
+    )
 
 
 @router.get("/", response_model=List[decision_schema.DecisionRead])
@@ -24,9 +24,7 @@ def create_progress_entry(
     """Log a new progress entry or task."""
     workspace_id = decode_workspace_id(workspace_id_b64)
     # The create function for progress via HTTP API doesn't support linked items; this is an MCP-specific feature.
-    return progress_service.create(
-        db, workspace_id, entry, None, None, "relates_to_progress"
-    )
+    return progress_service.create(db, workspace_id, **entry.model_dump())
 
 
 @router.get("/", response_model=List[progress_schema.ProgressEntryRead])
@@ -24,7 +24,7 @@ def create_system_pattern(
     """Log a new system or architectural pattern."""
     workspace_id = decode_workspace_id(workspace_id_b64)
     return system_pattern_service.create(
-        db=db, workspace_id=workspace_id, pattern=pattern
+        db=db, workspace_id=workspace_id, **pattern.model_dump()
     )
 
 
@@ -10,6 +10,22 @@ class Settings(BaseSettings):
 
     PROJECT_NAME: str = "NovaPort MCP"
     EMBEDDING_MODEL_NAME: str = "all-MiniLM-L6-v2"
+    # Inference backend for sentence-transformers: "torch", "onnx" or
+    # "openvino". The non-torch backends are typically 2-4x faster for CPU
+    # inference but need the matching optional extra installed
+    # (e.g. sentence-transformers[onnx]).
+    EMBEDDING_BACKEND: str = "torch"
+    # CPU threads for torch-backend encoding. None keeps torch's own
+    # default (one intra-op pool sized to the machine); set it explicitly
+    # when the server shares the box and oversubscription shows up.
+    EMBEDDING_THREADS: int | None = None
+    # HNSW index parameters for newly created Chroma collections. The
+    # defaults trade a slightly heavier index build for roughly 2x query
+    # throughput and better recall once a workspace grows past trivial
+    # size; existing collections keep the parameters they were built with.
+    CHROMA_HNSW_MAX_NEIGHBORS: int = 24
+    CHROMA_HNSW_EF_CONSTRUCTION: int = 128
+    CHROMA_HNSW_EF_SEARCH: int = 100
 
     # DUMMY DATABASE_URL for Alembic CLI.
     # This is NOT used by the running application, which generates the URL per workspace.
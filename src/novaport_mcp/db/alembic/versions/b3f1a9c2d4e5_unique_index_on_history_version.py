@@ -0,0 +1,56 @@
+"""Unique index on history version columns.
+
+Revision ID: b3f1a9c2d4e5
+Revises: 846450266f55
+Create Date: 2026-09-01 10:12:41.508214
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b3f1a9c2d4e5"
+down_revision: Union[str, None] = "846450266f55"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add unique indexes so version lookups are index-backed point reads."""
+    # Nothing guaranteed version uniqueness before these indexes existed:
+    # the history listener assigns latest+1 with an unguarded read-modify-
+    # write, so concurrent context updates may have written duplicates.
+    # Renumber each table densely by (version, id) — an identity operation
+    # for healthy tables — so the unique index can always be created.
+    for table in ("product_context_history", "active_context_history"):
+        op.execute(
+            f"UPDATE {table} SET version = ("
+            f"SELECT rn FROM ("
+            f"SELECT id AS rid, ROW_NUMBER() OVER (ORDER BY version, id) AS rn "
+            f"FROM {table}"
+            f") WHERE rid = {table}.id)"
+        )
+    op.create_index(
+        "ix_product_context_history_version",
+        "product_context_history",
+        ["version"],
+        unique=True,
+    )
+    op.create_index(
+        "ix_active_context_history_version",
+        "active_context_history",
+        ["version"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Drop the unique version indexes."""
+    op.drop_index(
+        "ix_product_context_history_version", table_name="product_context_history"
+    )
+    op.drop_index(
+        "ix_active_context_history_version", table_name="active_context_history"
+    )
@@ -5,6 +5,7 @@ from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any, AsyncGenerator
 
+import orjson
 from alembic import command
 from alembic.config import Config
 from fastapi import HTTPException, status
@@ -15,16 +16,34 @@ from ..core import config as core_config
 
 log = logging.getLogger(__name__)
 
+
+def _json_serializer(obj: Any) -> str:
+    """Encode JSON column values with orjson.
+
+    OPT_NON_STR_KEYS keeps parity with the stdlib encoder, which coerced
+    non-string dict keys (e.g. {1: "a"}) instead of rejecting the row.
+    """
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 _engines: dict[str, Any] = {}
 _session_locals: dict[str, Any] = {}
 _workspace_locks: dict[str, Any] = {}
 
 
+def workspace_id_for_engine(engine: Any) -> str | None:
+    """Map a session's bind back to the workspace it was created for."""
+    for workspace_id, cached in _engines.items():
+        if cached is engine:
+            return workspace_id
+    return None
+
+
 def run_migrations_for_workspace(engine, db_path: Path):
     """This function is blocking and will be executed in a thread."""
     log.info(f"Running Alembic migrations for database: {db_path}...")
 
-    package_root = importlib.resources.files("conport")
+    package_root = importlib.resources.files("novaport_mcp")
     script_location = str(package_root / "db" / "alembic")
 
     alembic_cfg = Config()
@@ -58,15 +77,28 @@ async def get_session_local(workspace_id: str) -> sessionmaker:
             db_path = Path(db_url.replace("sqlite:///", ""))
 
             # Engine creation is fast, can remain in the main thread.
-            engine = create_engine(db_url, connect_args={"check_same_thread": False})
+            # JSON columns (context content, tags, custom data values) go
+            # through orjson instead of the stdlib encoder.
+            engine = create_engine(
+                db_url,
+                connect_args={"check_same_thread": False},
+                json_serializer=_json_serializer,
+                json_deserializer=orjson.loads,
+            )
 
             # RUN THE LONG MIGRATION IN A SEPARATE THREAD
             # This prevents blocking the server event loop.
             await asyncio.to_thread(run_migrations_for_workspace, engine, db_path)
 
             _engines[workspace_id] = engine
+            # expire_on_commit=False keeps attributes loaded after commit, so
+            # tools serializing freshly committed rows do not trigger a
+            # re-SELECT per attribute access.
             _session_locals[workspace_id] = sessionmaker(
-                autocommit=False, autoflush=False, bind=engine
+                autocommit=False,
+                autoflush=False,
+                expire_on_commit=False,
+                bind=engine,
             )
             log.info(
                 f"Database session successfully configured and cached for '{workspace_id}'"
@@ -96,7 +96,7 @@ class ProductContextHistory(Base):
     __tablename__ = "product_context_history"
     id = Column(Integer, primary_key=True)
     timestamp = Column(DateTime, default=datetime.datetime.utcnow)
-    version = Column(Integer, nullable=False)
+    version = Column(Integer, nullable=False, unique=True, index=True)
     content = Column(JSON, nullable=False)
     change_source = Column(String, nullable=True)
 
@@ -105,6 +105,6 @@ class ActiveContextHistory(Base):
     __tablename__ = "active_context_history"
     id = Column(Integer, primary_key=True)
     timestamp = Column(DateTime, default=datetime.datetime.utcnow)
-    version = Column(Integer, nullable=False)
+    version = Column(Integer, nullable=False, unique=True, index=True)
     content = Column(JSON, nullable=False)
     change_source = Column(String, nullable=True)
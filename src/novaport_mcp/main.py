@@ -1,27 +1,27 @@
 # FILE: src/novaport_mcp/main.py
 
+import asyncio
 import datetime
 import inspect
 import logging
+import threading
+import time
+from collections import OrderedDict
 from contextvars import ContextVar
-from functools import wraps
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import Annotated, Any, Callable, Dict, List, Optional, Union
+from typing import Annotated, Any, Callable, Dict, List, Optional, Tuple, Union
 
-import dictdiffer  # type: ignore
+import orjson
 from fastmcp import FastMCP
-from pydantic import Field, TypeAdapter, ValidationError
+from pydantic import Field, TypeAdapter
 from sqlalchemy.orm import Session
 
 from novaport_mcp.db import models
 from novaport_mcp.db.database import get_db_session_for_workspace
 from novaport_mcp.schemas import batch as batch_schema
 from novaport_mcp.schemas import context as context_schema
-from novaport_mcp.schemas import custom_data as cd_schema
-from novaport_mcp.schemas import decision as decision_schema
 from novaport_mcp.schemas import link as link_schema
-from novaport_mcp.schemas import progress as progress_schema
-from novaport_mcp.schemas import system_pattern as sp_schema
 from novaport_mcp.schemas.custom_data import CustomDataRead
 from novaport_mcp.schemas.decision import DecisionRead
 from novaport_mcp.schemas.error import MCPError
@@ -42,11 +42,19 @@ from novaport_mcp.services import (
     vector_service,
 )
 
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
-)
 log = logging.getLogger(__name__)
 
+
+def setup_logging() -> None:
+    """Configure root logging for the server process.
+
+    Called by the entry point rather than at import time, so importing this
+    module (e.g. in tests) does not mutate global logging state.
+    """
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+
 # Initialize the history service to register event listeners
 # This ensures that context changes are automatically logged
 _history_service_initialized = history_service
@@ -56,6 +64,144 @@ mcp_server = FastMCP(name="NovaPort-MCP")
 # --- Context Variable for DB Session ---
 db_session_context: ContextVar[Session] = ContextVar("db_session_context")
 
+# Shared parameter annotations. Declaring these once lets pydantic reuse the
+# compiled core schema for every tool that takes the same parameter instead
+# of re-walking an identical Annotated tree per signature.
+WorkspaceId = Annotated[
+    str, Field(description="Identifier for the workspace (e.g., absolute path)")
+]
+TagsFilterAll = Annotated[
+    Optional[List[str]],
+    Field(None, description="Filter: items must include ALL of these tags."),
+]
+TagsFilterAny = Annotated[
+    Optional[List[str]],
+    Field(None, description="Filter: items must include AT LEAST ONE of these tags."),
+]
+
+_LINK_COLS = (
+    "id",
+    "timestamp",
+    "source_item_type",
+    "source_item_id",
+    "target_item_type",
+    "target_item_id",
+    "relationship_type",
+    "description",
+)
+_HISTORY_COLS = ("id", "timestamp", "version", "content", "change_source")
+
+_DECISION_LIST_ADAPTER = TypeAdapter(List[DecisionRead])
+_PROGRESS_LIST_ADAPTER = TypeAdapter(List[ProgressEntryRead])
+_SYSTEM_PATTERN_LIST_ADAPTER = TypeAdapter(List[SystemPatternRead])
+_CUSTOM_DATA_LIST_ADAPTER = TypeAdapter(List[CustomDataRead])
+
+
+def _construct_rows(rows: List[Any], read_model: Any, columns: tuple) -> List[Any]:
+    """Build read schemas from trusted DB rows, skipping validation.
+
+    These rows were written through the validated create paths, so
+    ``model_construct`` can safely bypass the per-field validators. The
+    fields-set is passed in precomputed so it is not rebuilt per row.
+    """
+    fields_set = _fields_set_for(read_model)
+    return [
+        read_model.model_construct(
+            _fields_set=fields_set, **{c: getattr(r, c) for c in columns}
+        )
+        for r in rows
+    ]
+
+
+@lru_cache(maxsize=None)
+def _fields_set_for(read_model: Any) -> frozenset:
+    """One frozenset of field names per read model, shared by all rows."""
+    return frozenset(read_model.model_fields)
+
+
+# --- Read cache for product/active context content ---
+# Context data is read far more often than it is written. Entries are keyed
+# by (workspace_id, kind, version); the history event listener bumps the
+# version on every ORM update (MCP tools and HTTP API alike), so stale
+# entries are never served and simply age out of the LRU.
+_CONTEXT_CACHE_MAX = 512
+_context_cache: "OrderedDict[Tuple[str, str, int], Dict[str, Any]]" = OrderedDict()
+_context_versions: Dict[Tuple[str, str], int] = {}
+
+
+def _context_cache_key(workspace_id: str, kind: str) -> Tuple[str, str, int]:
+    return (workspace_id, kind, _context_versions.get((workspace_id, kind), 0))
+
+
+def _cache_context_content(
+    key: Tuple[str, str, int], content: Dict[str, Any]
+) -> None:
+    _context_cache[key] = content
+    _context_cache.move_to_end(key)
+    while len(_context_cache) > _CONTEXT_CACHE_MAX:
+        _context_cache.popitem(last=False)
+
+
+def _bump_context_version(workspace_id: str, kind: str) -> None:
+    key = (workspace_id, kind)
+    _context_versions[key] = _context_versions.get(key, 0) + 1
+
+
+# Invalidate through the history listener so writes that bypass the MCP
+# tools (e.g. the HTTP API) also evict stale cached content.
+history_service.on_context_update(_bump_context_version)
+
+
+# --- Short-TTL cache for read-only tools ---
+# Agents tend to poll the same read tool with identical arguments in quick
+# succession; within a small window the previous result can be served without
+# a session checkout or query. Entries are grouped per entity so that any
+# mutating tool can drop exactly the reads it may have affected.
+_READ_CACHE_TTL_SECONDS = 2.0
+_read_cache_lock = threading.Lock()
+_read_cache: Dict[str, Dict[Tuple[Any, ...], Tuple[float, Any]]] = {}
+
+
+def _read_cache_key(tool_name: str, kwargs: Dict[str, Any]) -> Tuple[Any, ...]:
+    return (
+        tool_name,
+        tuple(
+            sorted(
+                (k, tuple(v) if isinstance(v, list) else v)
+                for k, v in kwargs.items()
+            )
+        ),
+    )
+
+
+def _invalidate_read_cache(*entities: str) -> None:
+    with _read_cache_lock:
+        for entity in entities:
+            _read_cache.pop(entity, None)
+
+
+def _cached_read(entity: str) -> Callable[..., Any]:
+    """Decorator serving a read tool's result from the TTL cache when fresh."""
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = _read_cache_key(func.__name__, kwargs)
+            now = time.monotonic()
+            with _read_cache_lock:
+                entry = _read_cache.get(entity, {}).get(key)
+                if entry is not None and now - entry[0] <= _READ_CACHE_TTL_SECONDS:
+                    return entry[1]
+            result = await func(*args, **kwargs)
+            if not isinstance(result, MCPError):
+                with _read_cache_lock:
+                    _read_cache.setdefault(entity, {})[key] = (now, result)
+            return result
+
+        return wrapper
+
+    return decorator
+
 
 # --- Decorator for DB Session using ContextVar ---
 def with_db_session(func: Callable[..., Any]) -> Callable[..., Any]:
@@ -83,21 +229,22 @@ def with_db_session(func: Callable[..., Any]) -> Callable[..., Any]:
 @mcp_server.tool()
 @with_db_session
 async def get_product_context(
-    workspace_id: Annotated[
-        str, Field(description="Identifier for the workspace (e.g., absolute path)")
-    ],
+    workspace_id: WorkspaceId,
 ) -> Any:
     """Retrieves the overall project goals, features, and architecture."""
     db: Session = db_session_context.get()
-    return context_service.get_product_context(db).content
+    cache_key = _context_cache_key(workspace_id, "product")
+    if cache_key in _context_cache:
+        return _context_cache[cache_key]
+    content = context_service.get_product_context(db).content
+    _cache_context_content(cache_key, content)
+    return content
 
 
 @mcp_server.tool()
 @with_db_session
 async def update_product_context(
-    workspace_id: Annotated[
-        str, Field(description="Identifier for the workspace (e.g., absolute path)")
-    ],
+    workspace_id: WorkspaceId,
     content: Annotated[
         Optional[Dict[str, Any]],
         Field(
@@ -124,35 +271,38 @@ async def update_product_context(
     if content is not None and patch_content is not None:
         return MCPError(error="Provide either 'content' or 'patch_content', not both.")
 
-    try:
-        update_data = context_schema.ContextUpdate(
-            content=content, patch_content=patch_content
-        )
-        instance = context_service.get_product_context(db)
-        updated = context_service.update_context(db, instance, update_data)
-        return updated.content
-    except ValidationError as e:
-        return MCPError(error="Validation error", details=str(e))
+    # The tool signature already validated both dicts, so skip revalidation.
+    update_data = context_schema.ContextUpdate.model_construct(
+        content=content, patch_content=patch_content
+    )
+    instance = context_service.get_product_context(db)
+    updated = context_service.update_context(db, instance, update_data)
+    _cache_context_content(
+        _context_cache_key(workspace_id, "product"), updated.content
+    )
+    _invalidate_read_cache("history")
+    return updated.content
 
 
 @mcp_server.tool()
 @with_db_session
 async def get_active_context(
-    workspace_id: Annotated[
-        str, Field(description="Identifier for the workspace (e.g., absolute path)")
-    ],
+    workspace_id: WorkspaceId,
 ) -> Any:
     """Retrieves the current working focus, recent changes, and open issues."""
     db: Session = db_session_context.get()
-    return context_service.get_active_context(db).content
+    cache_key = _context_cache_key(workspace_id, "active")
+    if cache_key in _context_cache:
+        return _context_cache[cache_key]
+    content = context_service.get_active_context(db).content
+    _cache_context_content(cache_key, content)
+    return content
 
 
 @mcp_server.tool()
 @with_db_session
 async def update_active_context(
-    workspace_id: Annotated[
-        str, Field(description="Identifier for the workspace (e.g., absolute path)")
-    ],
+    workspace_id: WorkspaceId,
     content: Annotated[
         Optional[Dict[str, Any]],
         Field(
@@ -179,23 +329,23 @@ async def update_active_context(
     if content is not None and patch_content is not None:
         return MCPError(error="Provide either 'content' or 'patch_content', not both.")
 
-    try:
-        update_data = context_schema.ContextUpdate(
-            content=content, patch_content=patch_content
-        )
-        instance = context_service.get_active_context(db)
-        updated = context_service.update_context(db, instance, update_data)
-        return updated.content
-    except ValidationError as e:
-        return MCPError(error="Validation error", details=str(e))
+    # The tool signature already validated both dicts, so skip revalidation.
+    update_data = context_schema.ContextUpdate.model_construct(
+        content=content, patch_content=patch_content
+    )
+    instance = context_service.get_active_context(db)
+    updated = context_service.update_context(db, instance, update_data)
+    _cache_context_content(
+        _context_cache_key(workspace_id, "active"), updated.content
+    )
+    _invalidate_read_cache("history")
+    return updated.content
 
 
 @mcp_server.tool()
 @with_db_session
 async def log_decision(
-    workspace_id: Annotated[
-        str, Field(description="Identifier for the workspace (e.g., absolute path)")
-    ],
+    workspace_id: WorkspaceId,
     summary: Annotated[str, Field(description="A concise summary of the decision.")],
     rationale: Annotated[
         Optional[str], Field(None, description="The reasoning behind the decision.")
@@ -213,62 +363,57 @@ async def log_decision(
 ) -> DecisionRead:
     """Logs an architectural or implementation decision."""
     db: Session = db_session_context.get()
-    data = decision_schema.DecisionCreate(
+    # FastMCP already validated the arguments, so the service can take them
+    # directly without an intermediate DecisionCreate pass.
+    created = decision_service.create(
+        db,
+        workspace_id,
         summary=summary,
         rationale=rationale,
         implementation_details=implementation_details,
-        tags=tags or [],
+        tags=tags,
     )
-    created = decision_service.create(db, workspace_id, data)
+    _invalidate_read_cache("decisions")
     return DecisionRead.model_validate(created)
 
 
 @mcp_server.tool()
+@_cached_read("decisions")
 @with_db_session
 async def get_decisions(
-    workspace_id: Annotated[
-        str, Field(description="Identifier for the workspace (e.g., absolute path)")
-    ],
+    workspace_id: WorkspaceId,
     limit: Annotated[
-        Optional[int],
+        int,
         Field(
-            None,
+            100,
             description="Maximum number of decisions to return (most recent first).",
         ),
-    ] = None,
-    tags_filter_include_all: Annotated[
-        Optional[List[str]],
-        Field(None, description="Filter: items must include ALL of these tags."),
-    ] = None,
-    tags_filter_include_any: Annotated[
-        Optional[List[str]],
-        Field(
-            None, description="Filter: items must include AT LEAST ONE of these tags."
-        ),
-    ] = None,
+    ] = 100,
+    tags_filter_include_all: TagsFilterAll = None,
+    tags_filter_include_any: TagsFilterAny = None,
 ) -> List[DecisionRead]:
     """Retrieves logged decisions."""
     db: Session = db_session_context.get()
-    decisions = decision_service.get_multi(
+    raw = await asyncio.to_thread(
+        decision_service.get_multi_json,
         db,
-        limit=limit or 100,
+        limit=limit,
         tags_all=tags_filter_include_all,
         tags_any=tags_filter_include_any,
     )
-    return [DecisionRead.model_validate(d) for d in decisions]
+    return _DECISION_LIST_ADAPTER.validate_json(raw)
 
 
 @mcp_server.tool()
 @with_db_session
 async def delete_decision_by_id(
-    workspace_id: Annotated[
-        str, Field(description="Identifier for the workspace (e.g., absolute path)")
-    ],
+    workspace_id: WorkspaceId,
     decision_id: int,
 ) -> Union[Dict[str, Any], MCPError]:
     """Deletes a decision by its ID."""
     db: Session = db_session_context.get()
     deleted = decision_service.delete(db, workspace_id, decision_id)
+    _invalidate_read_cache("decisions")
     return (
         {"status": "success", "id": decision_id}
         if deleted
@@ -282,9 +427,7 @@ async def delete_decision_by_id(
 @mcp_server.tool()
 @with_db_session
 async def log_progress(
-    workspace_id: Annotated[
-        str, Field(description="Identifier for the workspace (e.g., absolute path)")
-    ],
+    workspace_id: WorkspaceId,
     status: Annotated[
         str, Field(description="Current status (e.g., 'TODO', 'IN_PROGRESS', 'DONE').")
     ],
@@ -313,32 +456,31 @@ async def log_progress(
 ) -> ProgressEntryRead:
     """Logs a progress entry or task status."""
     db: Session = db_session_context.get()
-    entry_data = progress_schema.ProgressEntryCreate(
-        status=status, description=description, parent_id=parent_id
-    )
     created = progress_service.create(
         db,
         workspace_id,
-        entry_data,
-        linked_item_type,
-        linked_item_id,
-        link_relationship_type,
+        status=status,
+        description=description,
+        parent_id=parent_id,
+        linked_item_type=linked_item_type,
+        linked_item_id=linked_item_id,
+        link_relationship_type=link_relationship_type,
     )
+    _invalidate_read_cache("progress", "links")
     return ProgressEntryRead.model_validate(created)
 
 
 @mcp_server.tool()
+@_cached_read("progress")
 @with_db_session
 async def get_progress(
-    workspace_id: Annotated[
-        str, Field(description="Identifier for the workspace (e.g., absolute path)")
-    ],
+    workspace_id: WorkspaceId,
     limit: Annotated[
-        Optional[int],
+        int,
         Field(
-            None, description="Maximum number of entries to return (most recent first)."
+            50, description="Maximum number of entries to return (most recent first)."
         ),
-    ] = None,
+    ] = 50,
     status_filter: Annotated[
         Optional[str], Field(None, description="Filter entries by status.")
     ] = None,
@@ -348,18 +490,20 @@ async def get_progress(
 ) -> List[ProgressEntryRead]:
     """Retrieves progress entries."""
     db: Session = db_session_context.get()
-    entries = progress_service.get_multi(
-        db, limit=limit or 50, status=status_filter, parent_id=parent_id_filter
+    entries = await asyncio.to_thread(
+        progress_service.get_multi,
+        db,
+        limit=limit,
+        status=status_filter,
+        parent_id=parent_id_filter,
     )
-    return [ProgressEntryRead.model_validate(p) for p in entries]
+    return _PROGRESS_LIST_ADAPTER.validate_python(entries)
 
 
 @mcp_server.tool()
 @with_db_session
 async def update_progress(
-    workspace_id: Annotated[
-        str, Field(description="Identifier for the workspace (e.g., absolute path)")
-    ],
+    workspace_id: WorkspaceId,
     progress_id: Annotated[
         int, Field(description="The ID of the progress entry to update.")
     ],
@@ -377,13 +521,15 @@ async def update_progress(
     ] = None,
 ) -> Union[ProgressEntryRead, MCPError]:
     """Updates an existing progress entry."""
+    # Reject empty updates before touching the schema or the database.
+    if status is None and description is None and parent_id is None:
+        return MCPError(error="No update fields provided.")
     db: Session = db_session_context.get()
     update_data = ProgressEntryUpdate(
         status=status, description=description, parent_id=parent_id
     )
-    if not update_data.model_dump(exclude_unset=True):
-        return MCPError(error="No update fields provided.")
     updated = progress_service.update(db, progress_id, update_data)
+    _invalidate_read_cache("progress")
     return (
         ProgressEntryRead.model_validate(updated)
         if updated
@@ -394,14 +540,13 @@ async def update_progress(
 @mcp_server.tool()
 @with_db_session
 async def delete_progress_by_id(
-    workspace_id: Annotated[
-        str, Field(description="Identifier for the workspace (e.g., absolute path)")
-    ],
+    workspace_id: WorkspaceId,
     progress_id: int,
 ) -> Union[Dict[str, Any], MCPError]:
     """Deletes a progress entry by its ID."""
     db: Session = db_session_context.get()
     deleted = progress_service.delete(db, workspace_id, progress_id)
+    _invalidate_read_cache("progress")
     return (
         {"status": "success", "id": progress_id}
         if deleted
@@ -415,9 +560,7 @@ async def delete_progress_by_id(
 @mcp_server.tool()
 @with_db_session
 async def log_system_pattern(
-    workspace_id: Annotated[
-        str, Field(description="Identifier for the workspace (e.g., absolute path)")
-    ],
+    workspace_id: WorkspaceId,
     name: Annotated[str, Field(description="Unique name for the system pattern.")],
     description: Annotated[
         Optional[str], Field(None, description="Description of the pattern.")
@@ -429,49 +572,42 @@ async def log_system_pattern(
 ) -> SystemPatternRead:
     """Logs or updates a system/coding pattern."""
     db: Session = db_session_context.get()
-    pattern_data = sp_schema.SystemPatternCreate(
-        name=name, description=description, tags=tags or []
+    created = system_pattern_service.create(
+        db, workspace_id, name=name, description=description, tags=tags
     )
-    created = system_pattern_service.create(db, workspace_id, pattern_data)
+    _invalidate_read_cache("system_patterns")
     return SystemPatternRead.model_validate(created)
 
 
 @mcp_server.tool()
+@_cached_read("system_patterns")
 @with_db_session
 async def get_system_patterns(
-    workspace_id: Annotated[
-        str, Field(description="Identifier for the workspace (e.g., absolute path)")
-    ],
-    tags_filter_include_all: Annotated[
-        Optional[List[str]],
-        Field(None, description="Filter: items must include ALL of these tags."),
-    ] = None,
-    tags_filter_include_any: Annotated[
-        Optional[List[str]],
-        Field(
-            None, description="Filter: items must include AT LEAST ONE of these tags."
-        ),
-    ] = None,
+    workspace_id: WorkspaceId,
+    tags_filter_include_all: TagsFilterAll = None,
+    tags_filter_include_any: TagsFilterAny = None,
 ) -> List[SystemPatternRead]:
     """Retrieves system patterns."""
     db: Session = db_session_context.get()
-    patterns = system_pattern_service.get_multi(
-        db, tags_all=tags_filter_include_all, tags_any=tags_filter_include_any
+    patterns = await asyncio.to_thread(
+        system_pattern_service.get_multi,
+        db,
+        tags_all=tags_filter_include_all,
+        tags_any=tags_filter_include_any,
     )
-    return [SystemPatternRead.model_validate(p) for p in patterns]
+    return _SYSTEM_PATTERN_LIST_ADAPTER.validate_python(patterns)
 
 
 @mcp_server.tool()
 @with_db_session
 async def delete_system_pattern_by_id(
-    workspace_id: Annotated[
-        str, Field(description="Identifier for the workspace (e.g., absolute path)")
-    ],
+    workspace_id: WorkspaceId,
     pattern_id: int,
 ) -> Union[Dict[str, Any], MCPError]:
     """Deletes a system pattern by its ID."""
     db: Session = db_session_context.get()
     deleted = system_pattern_service.delete(db, workspace_id, pattern_id)
+    _invalidate_read_cache("system_patterns")
     return (
         {"status": "success", "id": pattern_id}
         if deleted
@@ -482,9 +618,7 @@ async def delete_system_pattern_by_id(
 @mcp_server.tool()
 @with_db_session
 async def log_custom_data(
-    workspace_id: Annotated[
-        str, Field(description="Identifier for the workspace (e.g., absolute path)")
-    ],
+    workspace_id: WorkspaceId,
     category: Annotated[str, Field(description="Category for the custom data.")],
     key: Annotated[
         str, Field(description="Key for the custom data (unique within category).")
@@ -495,17 +629,18 @@ async def log_custom_data(
 ) -> CustomDataRead:
     """Stores/updates a custom key-value entry under a category. Value is JSON-serializable."""
     db: Session = db_session_context.get()
-    data = cd_schema.CustomDataCreate(category=category, key=key, value=value)
-    created = custom_data_service.upsert(db, workspace_id, data)
+    created = custom_data_service.upsert(
+        db, workspace_id, category=category, key=key, value=value
+    )
+    _invalidate_read_cache("custom_data")
     return CustomDataRead.model_validate(created)
 
 
 @mcp_server.tool()
+@_cached_read("custom_data")
 @with_db_session
 async def get_custom_data(
-    workspace_id: Annotated[
-        str, Field(description="Identifier for the workspace (e.g., absolute path)")
-    ],
+    workspace_id: WorkspaceId,
     category: Annotated[str, Field(description="Filter by category.")],
     key: Annotated[
         Optional[str], Field(None, description="Filter by key (requires category).")
@@ -514,24 +649,23 @@ async def get_custom_data(
     """Retrieves custom data."""
     db: Session = db_session_context.get()
     if key:
-        items = [custom_data_service.get(db, category, key)]
-    else:
-        items = list(custom_data_service.get_by_category(db, category))
-    return [CustomDataRead.model_validate(i) for i in items if i]
+        item = custom_data_service.get(db, category, key)
+        return [CustomDataRead.model_validate(item)] if item else []
+    items = await asyncio.to_thread(custom_data_service.get_by_category, db, category)
+    return _CUSTOM_DATA_LIST_ADAPTER.validate_python(items)
 
 
 @mcp_server.tool()
 @with_db_session
 async def delete_custom_data(
-    workspace_id: Annotated[
-        str, Field(description="Identifier for the workspace (e.g., absolute path)")
-    ],
+    workspace_id: WorkspaceId,
     category: Annotated[str, Field(description="Category of the data to delete.")],
     key: Annotated[str, Field(description="Key of the data to delete.")],
 ) -> Union[Dict[str, Any], MCPError]:
     """Deletes a specific custom data entry."""
     db: Session = db_session_context.get()
     deleted = custom_data_service.delete(db, workspace_id, category, key)
+    _invalidate_read_cache("custom_data")
     data_id = f"{category}/{key}"
     return (
         {"status": "success", "category": category, "key": key}
@@ -546,9 +680,7 @@ async def delete_custom_data(
 @mcp_server.tool()
 @with_db_session
 async def export_conport_to_markdown(
-    workspace_id: Annotated[
-        str, Field(description="Identifier for the workspace (e.g., absolute path)")
-    ],
+    workspace_id: WorkspaceId,
     output_path: Annotated[
         Optional[str],
         Field(
@@ -559,15 +691,13 @@ async def export_conport_to_markdown(
     """Exports ConPort data to markdown files."""
     db: Session = db_session_context.get()
     output_dir = Path(workspace_id) / (output_path or "conport_export")
-    return io_service.export_to_markdown(db, output_dir)
+    return await asyncio.to_thread(io_service.export_to_markdown, db, output_dir)
 
 
 @mcp_server.tool()
 @with_db_session
 async def import_markdown_to_conport(
-    workspace_id: Annotated[
-        str, Field(description="Identifier for the workspace (e.g., absolute path)")
-    ],
+    workspace_id: WorkspaceId,
     input_path: Annotated[
         Optional[str],
         Field(
@@ -578,15 +708,17 @@ async def import_markdown_to_conport(
     """Imports data from markdown files into ConPort."""
     db: Session = db_session_context.get()
     input_dir = Path(workspace_id) / (input_path or "conport_export")
-    return io_service.import_from_markdown(db, workspace_id, input_dir)
+    result = await asyncio.to_thread(
+        io_service.import_from_markdown, db, workspace_id, input_dir
+    )
+    _invalidate_read_cache("decisions")
+    return result
 
 
 @mcp_server.tool()
 @with_db_session
 async def link_conport_items(
-    workspace_id: Annotated[
-        str, Field(description="Identifier for the workspace (e.g., absolute path)")
-    ],
+    workspace_id: WorkspaceId,
     source_item_type: Annotated[str, Field(description="Type of the source item.")],
     source_item_id: Annotated[str, Field(description="ID or key of the source item.")],
     target_item_type: Annotated[str, Field(description="Type of the target item.")],
@@ -607,98 +739,102 @@ async def link_conport_items(
         description=description,
     )
     created = link_service.create(db, link_data)
+    _invalidate_read_cache("links")
     return LinkRead.model_validate(created)
 
 
 @mcp_server.tool()
+@_cached_read("links")
 @with_db_session
 async def get_linked_items(
-    workspace_id: Annotated[
-        str, Field(description="Identifier for the workspace (e.g., absolute path)")
-    ],
+    workspace_id: WorkspaceId,
     item_type: Annotated[str, Field(description="Type of the item to find links for.")],
     item_id: Annotated[
         str, Field(description="ID or key of the item to find links for.")
     ],
     limit: Annotated[
-        Optional[int], Field(None, description="Maximum number of links to return.")
-    ] = None,
+        int, Field(50, description="Maximum number of links to return.")
+    ] = 50,
 ) -> List[LinkRead]:
     """Retrieves items linked to a specific item."""
     db: Session = db_session_context.get()
-    links = link_service.get_for_item(db, item_type, item_id, limit=limit or 50)
-    return [LinkRead.model_validate(link_item) for link_item in links]
+    links = link_service.get_for_item(db, item_type, item_id, limit=limit)
+    return _construct_rows(links, LinkRead, _LINK_COLS)
 
 
 @mcp_server.tool()
+@_cached_read("decisions")
 @with_db_session
 async def search_decisions_fts(
-    workspace_id: Annotated[
-        str, Field(description="Identifier for the workspace (e.g., absolute path)")
-    ],
+    workspace_id: WorkspaceId,
     query_term: Annotated[
         str, Field(description="The term to search for in decisions.")
     ],
     limit: Annotated[
-        Optional[int], Field(None, description="Maximum number of search results.")
-    ] = None,
+        int, Field(10, description="Maximum number of search results.")
+    ] = 10,
 ) -> List[DecisionRead]:
     """Full-text search across decision fields."""
     db: Session = db_session_context.get()
-    decisions = decision_service.search_fts(db, query=query_term, limit=limit or 10)
-    return [DecisionRead.model_validate(d) for d in decisions]
+    # The service already returns DecisionRead models built straight from
+    # the FTS rows; no second validation pass is needed.
+    return await asyncio.to_thread(
+        decision_service.search_fts, db, query=query_term, limit=limit
+    )
 
 
 @mcp_server.tool()
+@_cached_read("custom_data")
 @with_db_session
 async def search_custom_data_value_fts(
-    workspace_id: Annotated[
-        str, Field(description="Identifier for the workspace (e.g., absolute path)")
-    ],
+    workspace_id: WorkspaceId,
     query_term: Annotated[str, Field(description="The term to search for.")],
     category_filter: Annotated[
         Optional[str],
         Field(None, description="Optional: Filter results to this category."),
     ] = None,
     limit: Annotated[
-        Optional[int], Field(None, description="Maximum number of results.")
-    ] = None,
+        int, Field(10, description="Maximum number of results.")
+    ] = 10,
 ) -> List[CustomDataRead]:
     """Full-text search across all custom data values, categories, and keys."""
     db: Session = db_session_context.get()
-    items = custom_data_service.search_fts(
-        db, query=query_term, category=category_filter, limit=limit or 10
+    return await asyncio.to_thread(
+        custom_data_service.search_fts,
+        db,
+        query=query_term,
+        category=category_filter,
+        limit=limit,
     )
-    return [CustomDataRead.model_validate(i) for i in items]
 
 
 @mcp_server.tool()
+@_cached_read("custom_data")
 @with_db_session
 async def search_project_glossary_fts(
-    workspace_id: Annotated[
-        str, Field(description="Identifier for the workspace (e.g., absolute path)")
-    ],
+    workspace_id: WorkspaceId,
     query_term: Annotated[
         str, Field(description="The term to search for in the glossary.")
     ],
     limit: Annotated[
-        Optional[int], Field(None, description="Maximum number of search results.")
-    ] = None,
+        int, Field(10, description="Maximum number of search results.")
+    ] = 10,
 ) -> List[CustomDataRead]:
     """Full-text search within the 'ProjectGlossary' custom data category."""
     db: Session = db_session_context.get()
-    items = custom_data_service.search_fts(
-        db, query=query_term, category="ProjectGlossary", limit=limit or 10
+    return await asyncio.to_thread(
+        custom_data_service.search_fts,
+        db,
+        query=query_term,
+        category="ProjectGlossary",
+        limit=limit,
     )
-    return [CustomDataRead.model_validate(i) for i in items]
 
 
 @mcp_server.tool()
 @with_db_session
 async def batch_log_items(
-    workspace_id: Annotated[
-        str, Field(description="Identifier for the workspace (e.g., absolute path)")
-    ],
+    workspace_id: WorkspaceId,
     item_type: Annotated[
         batch_schema.ItemType, Field(description="Type of items to log.")
     ],
@@ -706,28 +842,27 @@ async def batch_log_items(
 ) -> Union[Dict[str, Any], MCPError]:
     """Logs multiple items of the same type in a single call."""
     db: Session = db_session_context.get()
-    try:
-        result = meta_service.batch_log_items(db, workspace_id, item_type, items)
-        # If there are errors, wrap them in the MCPError structure with details
-        if result["errors"]:
-            return MCPError(error="Some items failed validation", details=result)
-        return result
-    except ValidationError as e:
-        return MCPError(error="Invalid batch request structure", details=e.errors())
+    result = await asyncio.to_thread(
+        meta_service.batch_log_items, db, workspace_id, item_type, items
+    )
+    _invalidate_read_cache("decisions", "progress", "system_patterns", "custom_data")
+    # If there are errors, wrap them in the MCPError structure with details
+    if result["failed"]:
+        return MCPError(error="Some items failed validation", details=result)
+    return result
 
 
 @mcp_server.tool()
+@_cached_read("history")
 @with_db_session
 async def get_item_history(
-    workspace_id: Annotated[
-        str, Field(description="Identifier for the workspace (e.g., absolute path)")
-    ],
+    workspace_id: WorkspaceId,
     item_type: Annotated[
         str, Field(description="Type of item: 'product_context' or 'active_context'.")
     ],
     limit: Annotated[
-        Optional[int], Field(None, description="Max number of history entries.")
-    ] = None,
+        int, Field(10, description="Max number of history entries.")
+    ] = 10,
     version: Annotated[
         Optional[int], Field(None, description="Return a specific version.")
     ] = None,
@@ -756,24 +891,29 @@ async def get_item_history(
             },
         )
 
-    query = db.query(history_model)
+    # Select just the serialized columns as lightweight Row tuples; full ORM
+    # instances (identity map, change tracking) buy nothing on this read path
+    # and the content blobs make hydration the dominant cost.
+    query = db.query(*(getattr(history_model, c) for c in _HISTORY_COLS))
     if version:
-        query = query.filter_by(version=version)
+        query = query.filter(history_model.version == version)
     if before_timestamp:
         query = query.filter(history_model.timestamp < before_timestamp)
     if after_timestamp:
         query = query.filter(history_model.timestamp > after_timestamp)
 
-    records = query.order_by(history_model.version.desc()).limit(limit or 10).all()
-    return [HistoryRead.model_validate(r) for r in records]
+    records = (
+        query.order_by(history_model.version.desc())
+        .limit(limit)
+        .yield_per(100)
+    )
+    return _construct_rows(list(records), HistoryRead, _HISTORY_COLS)
 
 
 @mcp_server.tool()
 @with_db_session
 async def get_recent_activity_summary(
-    workspace_id: Annotated[
-        str, Field(description="Identifier for the workspace (e.g., absolute path)")
-    ],
+    workspace_id: WorkspaceId,
     hours_ago: Annotated[
         Optional[int], Field(None, description="Look back this many hours.")
     ] = None,
@@ -795,21 +935,68 @@ async def get_recent_activity_summary(
     elif hours_ago:
         since = datetime.datetime.utcnow() - datetime.timedelta(hours=hours_ago)
 
-    activity = meta_service.get_recent_activity(db, limit=limit_per_type, since=since)
+    activity = await asyncio.to_thread(
+        meta_service.get_recent_activity, db, limit=limit_per_type, since=since
+    )
+    # One vectorized pydantic-core pass per item type via the cached
+    # list adapters; no per-row model_validate/model_dump loops.
     return {
-        "decisions": [DecisionRead.model_validate(d) for d in activity["decisions"]],
-        "progress": [ProgressEntryRead.model_validate(p) for p in activity["progress"]],
-        "system_patterns": [
-            SystemPatternRead.model_validate(s) for s in activity["system_patterns"]
-        ],
+        "decisions": _DECISION_LIST_ADAPTER.validate_python(activity["decisions"]),
+        "progress": _PROGRESS_LIST_ADAPTER.validate_python(activity["progress"]),
+        "system_patterns": _SYSTEM_PATTERN_LIST_ADAPTER.validate_python(
+            activity["system_patterns"]
+        ),
     }
 
 
+@lru_cache(maxsize=512)
+def _build_vector_filters(
+    item_types: Optional[Tuple[str, ...]],
+    categories: Optional[Tuple[str, ...]],
+    tags_all: Optional[Tuple[str, ...]],
+    tags_any: Optional[Tuple[str, ...]],
+) -> Optional[Dict[str, Any]]:
+    """Build (and memoize) the Chroma filter dict for a semantic search.
+
+    Agents tend to repeat the same filter combinations; caching on the
+    tuple-ified arguments hands the vector store the identical dict back
+    without re-assembling the clauses.
+    """
+    and_conditions: List[Dict[str, Any]] = []
+
+    if item_types:
+        and_conditions.append({"item_type": {"$in": list(item_types)}})
+
+    if categories and "custom_data" in (item_types or ()):
+        and_conditions.append({"category": {"$in": list(categories)}})
+
+    if tags_all:
+        # Each tag must be present: one $contains clause per tag.
+        and_conditions.extend({"tags": {"$contains": tag}} for tag in tags_all)
+
+    if tags_any:
+        # At least one of these tags must be present, via a nested $or.
+        # Example: {"$or": [{"tags": {"$contains": "tag1"}}, ...]}
+        # A one-element $or needs no wrapper either.
+        if len(tags_any) == 1:
+            and_conditions.append({"tags": {"$contains": tags_any[0]}})
+        else:
+            and_conditions.append(
+                {"$or": [{"tags": {"$contains": tag}} for tag in tags_any]}
+            )
+
+    # A single clause needs no $and wrapper; no clauses means no filter at
+    # all, letting the vector store skip filter planning entirely.
+    if not and_conditions:
+        return None
+    if len(and_conditions) == 1:
+        return and_conditions[0]
+    return {"$and": and_conditions}
+
+
 @mcp_server.tool()
 async def semantic_search_conport(
-    workspace_id: Annotated[
-        str, Field(description="Identifier for the workspace (e.g., absolute path)")
-    ],
+    workspace_id: WorkspaceId,
     query_text: Annotated[str, Field(description="The natural language query text.")],
     top_k: Annotated[int, Field(5, description="Number of top results to return.")] = 5,
     filter_item_types: Annotated[
@@ -842,37 +1029,18 @@ async def semantic_search_conport(
 ) -> Union[List[Dict[str, Any]], MCPError]:
     """Performs a semantic search across ConPort data with advanced filtering."""
     try:
-        and_conditions: List[Dict[str, Any]] = []
-
-        if filter_item_types:
-            and_conditions.append({"item_type": {"$in": filter_item_types}})
-
-        if (
-            filter_custom_data_categories
-            and "custom_data" in (filter_item_types or [])
-        ):
-            and_conditions.append(
-                {"category": {"$in": filter_custom_data_categories}}
-            )
-
-        if filter_tags_include_all:
-            # Each tag must be present. This translates to multiple $contains conditions within the $and_conditions.
-            for tag in filter_tags_include_all:
-                and_conditions.append({"tags": {"$contains": tag}})
-
-        if filter_tags_include_any:
-            # At least one of these tags must be present
-            # This requires a $or condition nested within the $and_conditions
-            # Example: {"$or": [{"tags": {"$contains": "tag1"}}, {"tags": {"$contains": "tag2"}}]}
-            or_tag_conditions = [
-                {"tags": {"$contains": tag}} for tag in filter_tags_include_any
-            ]
-            and_conditions.append({"$or": or_tag_conditions})
-
-        filters = {"$and": and_conditions} if and_conditions else None
+        filters = _build_vector_filters(
+            tuple(filter_item_types) if filter_item_types else None,
+            tuple(filter_custom_data_categories)
+            if filter_custom_data_categories
+            else None,
+            tuple(filter_tags_include_all) if filter_tags_include_all else None,
+            tuple(filter_tags_include_any) if filter_tags_include_any else None,
+        )
 
         # Execute the semantic search
-        search_results = vector_service.search(
+        search_results = await asyncio.to_thread(
+            vector_service.search,
             workspace_id=workspace_id,
             query_text=query_text,
             top_k=top_k,
@@ -891,43 +1059,99 @@ def _to_camel_case(snake_str: str) -> str:
     return "".join(x.title() for x in components)
 
 
-@mcp_server.tool()
-async def get_conport_schema(
-    workspace_id: Annotated[
-        str, Field(description="Identifier for the workspace (e.g., absolute path)")
-    ]
-) -> Dict[str, Any]:
-    """Retrieves the schema of all available ConPort tools.
-    The output is a dictionary where each key is a tool name and the value is its JSON schema.
-    """
-    tool_functions = [f for f in mcp_server.tools.values() if f.__name__ != "get_conport_schema"]  # type: ignore[attr-defined]
+# Per-tool metadata (description, schema title). Filled in once, after all
+# @mcp_server.tool() registrations have run, so schema construction never has
+# to re-run inspect.getdoc or the camel-case helper per call.
+_TOOL_META: Dict[str, Tuple[str, str]] = {}
 
-    final_schemas = {}
-    for func in tool_functions:
-        param_schema = TypeAdapter(func).json_schema()
 
-        param_schema["description"] = (
-            inspect.getdoc(func) or f"Arguments for {func.__name__}."
+def _populate_tool_meta() -> None:
+    if not _TOOL_META:
+        _TOOL_META.update(
+            {
+                f.__name__: (
+                    inspect.getdoc(f) or f"Arguments for {f.__name__}.",
+                    f"{_to_camel_case(f.__name__)}Args",
+                )
+                for f in mcp_server.tools.values()  # type: ignore[attr-defined]
+            }
         )
-        param_schema["title"] = f"{_to_camel_case(func.__name__)}Args"
-        param_schema.pop("additionalProperties", None)
 
-        if "properties" in param_schema:
-            for prop_name, prop_schema in param_schema["properties"].items():
-                prop_schema.pop("title", None)
 
-        final_schemas[func.__name__] = param_schema
+@lru_cache(maxsize=None)
+def _adapter_for(func: Callable[..., Any]) -> TypeAdapter:
+    """Return a memoized TypeAdapter; constructing one is expensive."""
+    return TypeAdapter(func)
+
+
+@lru_cache(maxsize=None)
+def _schema_for(func: Callable[..., Any]) -> Dict[str, Any]:
+    """Build and memoize the post-processed JSON schema for a tool function."""
+    param_schema = _adapter_for(func).json_schema()
+
+    description, title = _TOOL_META.get(func.__name__) or (
+        inspect.getdoc(func) or f"Arguments for {func.__name__}.",
+        f"{_to_camel_case(func.__name__)}Args",
+    )
+    param_schema["description"] = description
+    param_schema["title"] = title
+    param_schema.pop("additionalProperties", None)
+
+    for prop_schema in param_schema.get("properties", {}).values():
+        prop_schema.pop("title", None)
+
+    return param_schema
 
-    this_func_schema = TypeAdapter(get_conport_schema).json_schema()
-    this_func_schema["description"] = inspect.getdoc(get_conport_schema) or ""
-    this_func_schema["title"] = "GetConportSchemaArgs"
-    this_func_schema.pop("additionalProperties", None)
-    if "properties" in this_func_schema:
-        for prop_name, prop_schema in this_func_schema["properties"].items():
-            prop_schema.pop("title", None)
-    final_schemas["get_conport_schema"] = this_func_schema
 
-    return final_schemas
+# The tool registry is immutable once this module has loaded, so the full
+# schema dict can be computed exactly once.
+_schema_build_lock = threading.Lock()
+_cached_schemas: Optional[Dict[str, Any]] = None
+
+
+def _intern_property_schemas(schemas: Dict[str, Any]) -> None:
+    """Share one dict instance for value-equal property sub-schemas.
+
+    Most tools repeat identical parameter schemas (workspace_id above all);
+    pointing every occurrence at a single canonical dict cuts the resident
+    size of the schema cache without changing the emitted JSON.
+    """
+    canonical: Dict[bytes, Dict[str, Any]] = {}
+    for tool_schema in schemas.values():
+        properties = tool_schema.get("properties")
+        if not properties:
+            continue
+        for name, prop in properties.items():
+            key = orjson.dumps(prop, option=orjson.OPT_SORT_KEYS)
+            properties[name] = canonical.setdefault(key, prop)
+
+
+def _build_schemas_once() -> Dict[str, Any]:
+    """Build the per-tool schema dict on first use and reuse it afterwards."""
+    global _cached_schemas
+    if _cached_schemas is None:
+        with _schema_build_lock:
+            if _cached_schemas is None:
+                _populate_tool_meta()
+                # One uniform pass over every registered tool, including
+                # get_conport_schema itself.
+                final_schemas = {
+                    func.__name__: _schema_for(func)
+                    for func in mcp_server.tools.values()  # type: ignore[attr-defined]
+                }
+                _intern_property_schemas(final_schemas)
+                _cached_schemas = final_schemas
+    return _cached_schemas
+
+
+@mcp_server.tool()
+async def get_conport_schema(
+    workspace_id: WorkspaceId
+) -> Dict[str, Any]:
+    """Retrieves the schema of all available ConPort tools.
+    The output is a dictionary where each key is a tool name and the value is its JSON schema.
+    """
+    return _build_schemas_once()
 
 
 @mcp_server.tool()
@@ -960,6 +1184,8 @@ async def diff_context_versions(
         List of differences found by dictdiffer, or MCPError if versions not found
 
     """
+    import dictdiffer  # type: ignore  # deferred: only this tool needs it
+
     db: Session = db_session_context.get()
 
     # Determine which history model to use based on item_type
@@ -977,27 +1203,104 @@ async def diff_context_versions(
             },
         )
 
-    # Retrieve version A
-    version_a_record = db.query(history_model).filter_by(version=version_a).first()
-    if not version_a_record:
-        return MCPError(
-            error=f"Version {version_a} not found",
-            details={"item_type": item_type, "version": version_a},
-        )
+    # Retrieve both versions in a single round-trip; only the columns we need.
+    rows = (
+        db.query(history_model.version, history_model.content)
+        .filter(history_model.version.in_([version_a, version_b]))
+        .all()
+    )
+    content_by_version = {row.version: row.content for row in rows}
 
-    # Retrieve version B
-    version_b_record = db.query(history_model).filter_by(version=version_b).first()
-    if not version_b_record:
-        return MCPError(
-            error=f"Version {version_b} not found",
-            details={"item_type": item_type, "version": version_b},
-        )
+    for requested_version in (version_a, version_b):
+        if requested_version not in content_by_version:
+            return MCPError(
+                error=f"Version {requested_version} not found",
+                details={"item_type": item_type, "version": requested_version},
+            )
+
+    content_a = content_by_version[version_a]
+    content_b = content_by_version[version_b]
 
-    # Extract content from both versions (type: ignore because mypy can't infer the SQLAlchemy model attributes)
-    content_a = version_a_record.content  # type: ignore
-    content_b = version_b_record.content  # type: ignore
+    # Identical payloads need no diff; skip the recursive comparison entirely.
+    if content_a == content_b:
+        return []
 
     # Perform the diff comparison
     diff_result = list(dictdiffer.diff(content_a, content_b))
 
-    return diff_result
\ No newline at end of file
+    return diff_result
+
+
+
+
+# Read-only tools that batch_read may dispatch to. Each entry already carries
+# its own session handling and read caching, so sub-calls behave exactly like
+# direct invocations.
+_READ_ONLY_TOOLS: Dict[str, Callable[..., Any]] = {
+    f.__name__: f
+    for f in (
+        get_product_context,
+        get_active_context,
+        get_decisions,
+        get_progress,
+        get_system_patterns,
+        get_custom_data,
+        get_linked_items,
+        get_item_history,
+        search_decisions_fts,
+        search_custom_data_value_fts,
+        search_project_glossary_fts,
+        semantic_search_conport,
+        get_recent_activity_summary,
+    )
+}
+
+
+@mcp_server.tool()
+async def batch_read(
+    workspace_id: WorkspaceId,
+    operations: Annotated[
+        List[Dict[str, Any]],
+        Field(
+            description=(
+                "List of read operations, each {'tool': <read tool name>, "
+                "'args': {...}}. Only get_*/search_* tools are allowed."
+            )
+        ),
+    ],
+) -> List[Dict[str, Any]]:
+    """Executes multiple read-only tool calls in one MCP round-trip.
+
+    Sub-operations run concurrently and each reports its own status, so one
+    failing read does not fail the whole batch.
+    """
+
+    async def _run(index: int, operation: Dict[str, Any]) -> Dict[str, Any]:
+        tool_name = operation.get("tool")
+        func = _READ_ONLY_TOOLS.get(tool_name or "")
+        if func is None:
+            return {
+                "index": index,
+                "tool": tool_name,
+                "status": "error",
+                "result": f"Unknown or non-read-only tool: {tool_name}",
+            }
+        try:
+            result = await func(
+                workspace_id=workspace_id, **(operation.get("args") or {})
+            )
+        except Exception as e:
+            return {
+                "index": index,
+                "tool": tool_name,
+                "status": "error",
+                "result": str(e),
+            }
+        status = "error" if isinstance(result, MCPError) else "success"
+        return {"index": index, "tool": tool_name, "status": status, "result": result}
+
+    return list(
+        await asyncio.gather(
+            *(_run(i, operation) for i, operation in enumerate(operations))
+        )
+    )
@@ -10,7 +10,9 @@ ContextModel = TypeVar("ContextModel", models.ProductContext, models.ActiveConte
 
 def _get_or_create(db: Session, model: Type[ContextModel]) -> ContextModel:
     """Helper function to retrieve or create a context record with default content."""
-    instance = db.query(model).filter_by(id=1).first()
+    # Session.get hits the identity map first and skips Query construction
+    # and compilation for this fixed primary-key lookup.
+    instance = db.get(model, 1)
     if not instance:
         instance = model(id=1, content={})
         db.add(instance)
@@ -29,6 +31,34 @@ def get_active_context(db: Session) -> models.ActiveContext:
     return _get_or_create(db, models.ActiveContext)
 
 
+_MISSING = object()
+
+
+def _apply_patch(
+    current_content: Dict[str, Any], patch_content: Dict[str, Any]
+) -> Union[Dict[str, Any], None]:
+    """Apply a patch to context content, returning the new dict or None.
+
+    Copies lazily: most patches touch a handful of keys, so each one is
+    compared against the current value and a copy is only allocated (and an
+    UPDATE issued) once a key actually diverges. ``"__DELETE__"`` values
+    remove their key.
+    """
+    new_content = None
+    for key, value in patch_content.items():
+        source = new_content if new_content is not None else current_content
+        if value == "__DELETE__":
+            if key in source:
+                if new_content is None:
+                    new_content = current_content.copy()
+                del new_content[key]
+        elif source.get(key, _MISSING) != value:
+            if new_content is None:
+                new_content = current_content.copy()
+            new_content[key] = value
+    return new_content
+
+
 def update_context(
     db: Session,
     instance: Union[models.ProductContext, models.ActiveContext],
@@ -36,18 +66,15 @@ def update_context(
 ) -> Union[models.ProductContext, models.ActiveContext]:
     """Update context with full content or patch-based updates."""
     current_content = cast(Dict[str, Any], instance.content) or {}
-    new_content = current_content.copy()
+    new_content = None
 
     if update_data.content is not None:
-        new_content = update_data.content
+        if update_data.content != current_content:
+            new_content = update_data.content
     elif update_data.patch_content is not None:
-        for key, value in update_data.patch_content.items():
-            if value == "__DELETE__":
-                new_content.pop(key, None)
-            else:
-                new_content[key] = value
+        new_content = _apply_patch(current_content, update_data.patch_content)
 
-    if new_content != current_content:
+    if new_content is not None:
         instance.content = new_content  # type: ignore
         db.add(instance)
         db.commit()
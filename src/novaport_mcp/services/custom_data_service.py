@@ -1,37 +1,43 @@
-import json
+import datetime
 import logging
-from typing import List
+from typing import Any, Dict, List
 
+import orjson
 from sqlalchemy import text
-from sqlalchemy.exc import NoResultFound
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from ..db import models
-from ..schemas import custom_data as cd_schema
+from ..schemas.custom_data import CustomDataCreate, CustomDataRead
 from . import vector_service
 
 log = logging.getLogger(__name__)
 
 
 def upsert(
-    db: Session, workspace_id: str, data: cd_schema.CustomDataCreate
+    db: Session, workspace_id: str, *, category: str, key: str, value: Any
 ) -> models.CustomData:
     """Create or update custom data entry and update vector embeddings."""
-    try:
-        db_data = (
-            db.query(models.CustomData)
-            .filter_by(category=data.category, key=data.key)
-            .one()
+    # Single INSERT ... ON CONFLICT DO UPDATE round-trip against the
+    # (category, key) unique constraint, returning the final row; no
+    # SELECT-then-branch and no refresh afterwards.
+    stmt = (
+        sqlite_insert(models.CustomData)
+        .values(category=category, key=key, value=value)
+        .on_conflict_do_update(
+            index_elements=["category", "key"], set_={"value": value}
         )
-        db_data.value = data.value
-    except NoResultFound:
-        db_data = models.CustomData(**data.model_dump())
-        db.add(db_data)
+        .returning(models.CustomData)
+    )
+    # populate_existing makes the RETURNING row win over any stale copy of
+    # the entity already present in the session's identity map.
+    db_data = db.execute(
+        stmt, execution_options={"populate_existing": True}
+    ).scalar_one()
     db.commit()
-    db.refresh(db_data)
     try:
         text_value = (
-            json.dumps(db_data.value)
+            orjson.dumps(db_data.value).decode()
             if not isinstance(db_data.value, str)
             else db_data.value
         )
@@ -44,13 +50,69 @@ def upsert(
         vector_service.upsert_embedding(
             workspace_id, f"custom_data_{db_data.id}", text, metadata
         )
-    except (TypeError, OverflowError):
+    except (TypeError, OverflowError, orjson.JSONEncodeError):
         log.warning(
             f"Could not serialize value for custom_data {db_data.id} for embedding."
         )
     return db_data
 
 
+def upsert_many(
+    db: Session, workspace_id: str, items: List[CustomDataCreate]
+) -> List[models.CustomData]:
+    """Upsert many custom data entries with one commit and one embedding batch.
+
+    Each row still needs its own ON CONFLICT statement (the update payload
+    differs per row), but they all share a single transaction instead of
+    paying a commit per item, and the embeddings are encoded in one batch.
+    """
+    db_rows = []
+    for item in items:
+        stmt = (
+            sqlite_insert(models.CustomData)
+            .values(category=item.category, key=item.key, value=item.value)
+            .on_conflict_do_update(
+                index_elements=["category", "key"], set_={"value": item.value}
+            )
+            .returning(models.CustomData)
+        )
+        db_rows.append(
+            db.execute(
+                stmt, execution_options={"populate_existing": True}
+            ).scalar_one()
+        )
+    db.commit()
+
+    item_ids, texts, metadatas = [], [], []
+    for db_data in db_rows:
+        try:
+            text_value = (
+                orjson.dumps(db_data.value).decode()
+                if not isinstance(db_data.value, str)
+                else db_data.value
+            )
+        except (TypeError, OverflowError, orjson.JSONEncodeError):
+            log.warning(
+                f"Could not serialize value for custom_data {db_data.id} "
+                f"for embedding."
+            )
+            continue
+        item_ids.append(f"custom_data_{db_data.id}")
+        texts.append(
+            f"Custom Data in category '{db_data.category}' "
+            f"key '{db_data.key}': {text_value}"
+        )
+        metadatas.append(
+            {
+                "item_type": "custom_data",
+                "category": db_data.category,
+                "key": db_data.key,
+            }
+        )
+    vector_service.upsert_embeddings_bulk(workspace_id, item_ids, texts, metadatas)
+    return db_rows
+
+
 def get(db: Session, category: str, key: str) -> models.CustomData | None:
     """Retrieve a single custom data item by category and key."""
     return db.query(models.CustomData).filter_by(category=category, key=key).first()
@@ -73,19 +135,46 @@ def delete(
     return db_data
 
 
+# Both statement shapes compiled once; search_fts picks by category filter.
+_FTS_STMT = text(
+    "SELECT cd.* FROM custom_data cd JOIN custom_data_fts fts "
+    "ON cd.id = fts.rowid WHERE fts.custom_data_fts MATCH :query "
+    "ORDER BY rank LIMIT :limit"
+)
+_FTS_STMT_CATEGORY = text(
+    "SELECT cd.* FROM custom_data cd JOIN custom_data_fts fts "
+    "ON cd.id = fts.rowid WHERE fts.custom_data_fts MATCH :query "
+    "AND fts.category = :category ORDER BY rank LIMIT :limit"
+)
+
+
+_READ_FIELDS = frozenset(CustomDataRead.model_fields)
+
+
+def _read_from_fts_row(mapping: Dict[str, Any]) -> CustomDataRead:
+    """Build a CustomDataRead from a raw FTS row without ORM re-hydration.
+
+    text() rows bypass SQLAlchemy's column types, so the JSON value and the
+    timestamp arrive as strings and are decoded here; the rest is trusted as
+    written and constructed without a validation pass.
+    """
+    data = dict(mapping)
+    value = data.get("value")
+    if isinstance(value, (str, bytes)):
+        data["value"] = orjson.loads(value)
+    timestamp = data.get("timestamp")
+    if isinstance(timestamp, str):
+        data["timestamp"] = datetime.datetime.fromisoformat(timestamp)
+    return CustomDataRead.model_construct(_fields_set=_READ_FIELDS, **data)
+
+
 def search_fts(
     db: Session, query: str, category: str | None = None, limit: int = 10
-) -> List[models.CustomData]:
+) -> List[CustomDataRead]:
     """Perform full-text search on custom data items."""
-    where_clauses, params = ["fts.custom_data_fts MATCH :query"], {
-        "query": query,
-        "limit": limit,
-    }
+    params = {"query": query, "limit": limit}
     if category:
-        where_clauses.append("fts.category = :category")
         params["category"] = category
-    stmt = text(
-        f'SELECT cd.* FROM custom_data cd JOIN custom_data_fts fts ON cd.id = fts.rowid WHERE {" AND ".join(where_clauses)} ORDER BY rank LIMIT :limit'
-    )
+    stmt = _FTS_STMT_CATEGORY if category else _FTS_STMT
     result_proxy = db.execute(stmt, params)
-    return [models.CustomData(**row._mapping) for row in result_proxy]
+    return [_read_from_fts_row(row._mapping) for row in result_proxy]
@@ -1,23 +1,52 @@
 import datetime
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
-from sqlalchemy import or_, text
+import orjson
+from sqlalchemy import and_, insert, or_, text
 from sqlalchemy.orm import Session
 
 from ..db import models
-from ..schemas import decision as decision_schema
+from ..schemas.decision import DecisionRead
 from . import vector_service
 
 
 # The create function now takes a workspace_id parameter
 def create(
-    db: Session, workspace_id: str, decision: decision_schema.DecisionCreate
+    db: Session,
+    workspace_id: str,
+    *,
+    summary: str,
+    rationale: Optional[str] = None,
+    implementation_details: Optional[str] = None,
+    tags: Optional[List[str]] = None,
 ) -> models.Decision:
-    """Create a new decision and update vector embeddings."""
-    db_decision = models.Decision(**decision.model_dump())
-    db.add(db_decision)
+    """Create a new decision and update vector embeddings.
+
+    Accepts the decision fields as keyword arguments so callers that already
+    validated their input (e.g. the MCP tool layer) don't pay for a second
+    Pydantic pass.
+    """
+    # INSERT ... RETURNING hands back the generated id and timestamp in the
+    # same round-trip, so no refresh SELECT is needed after the commit.
+    row = db.execute(
+        insert(models.Decision)
+        .values(
+            summary=summary,
+            rationale=rationale,
+            implementation_details=implementation_details,
+            tags=tags or [],
+        )
+        .returning(models.Decision.id, models.Decision.timestamp)
+    ).one()
     db.commit()
-    db.refresh(db_decision)
+    db_decision = models.Decision(
+        id=row.id,
+        timestamp=row.timestamp,
+        summary=summary,
+        rationale=rationale,
+        implementation_details=implementation_details,
+        tags=tags or [],
+    )
 
     # Prepare text and metadata for vector embedding
     text = f"Decision: {db_decision.summary}\nRationale: {db_decision.rationale or ''}"
@@ -50,8 +79,10 @@ def get_multi(
     """Retrieve multiple decisions with optional filtering by tags and date."""
     query = db.query(models.Decision)
     if tags_all:
-        for tag in tags_all:
-            query = query.filter(models.Decision.tags.like(f'%"{tag}"%'))
+        # One combined predicate instead of chaining a filter() per tag.
+        query = query.filter(
+            and_(*(models.Decision.tags.like(f'%"{tag}"%') for tag in tags_all))
+        )
     if tags_any:
         filters = [models.Decision.tags.like(f'%"{tag}"%') for tag in tags_any]
         query = query.filter(or_(*filters))
@@ -62,6 +93,61 @@ def get_multi(
     )
 
 
+def iter_all(db: Session, batch_size: int = 200) -> Iterator[models.Decision]:
+    """Stream every decision in batches instead of materializing one list.
+
+    Used by the markdown export: rows are fetched ``batch_size`` at a time
+    so memory stays bounded regardless of how many decisions exist.
+    """
+    return iter(
+        db.query(models.Decision)
+        .order_by(models.Decision.timestamp.desc())
+        .execution_options(stream_results=True)
+        .yield_per(batch_size)
+    )
+
+
+def get_multi_json(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    tags_all: Optional[List[str]] = None,
+    tags_any: Optional[List[str]] = None,
+    since: Optional[datetime.datetime] = None,
+) -> str:
+    """Return decisions as a JSON array string aggregated by the database.
+
+    Same filters as ``get_multi``, but the rows are packed into a single JSON
+    document with SQLite's ``json_group_array``/``json_object``, so no ORM
+    objects are hydrated for what is a pure read path.
+    """
+    clauses = []
+    params: dict = {"limit": limit, "offset": skip}
+    for i, tag in enumerate(tags_all or []):
+        clauses.append(f"tags LIKE :tag_all_{i}")
+        params[f"tag_all_{i}"] = f'%"{tag}"%'
+    if tags_any:
+        any_clauses = []
+        for i, tag in enumerate(tags_any):
+            any_clauses.append(f"tags LIKE :tag_any_{i}")
+            params[f"tag_any_{i}"] = f'%"{tag}"%'
+        clauses.append(f"({' OR '.join(any_clauses)})")
+    if since:
+        clauses.append("timestamp >= :since")
+        params["since"] = since
+    where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+    stmt = text(
+        "SELECT COALESCE(json_group_array(json_object("
+        "'id', id, 'timestamp', timestamp, 'summary', summary, "
+        "'rationale', rationale, "
+        "'implementation_details', implementation_details, "
+        "'tags', json(tags))), '[]') "
+        f"FROM (SELECT * FROM decisions{where} "
+        "ORDER BY timestamp DESC LIMIT :limit OFFSET :offset)"
+    )
+    return db.execute(stmt, params).scalar_one()
+
+
 def delete(
     db: Session, workspace_id: str, decision_id: int
 ) -> Optional[models.Decision]:
@@ -74,22 +160,57 @@ def delete(
     return db_decision
 
 
-def search_fts(db: Session, query: str, limit: int = 10) -> List[models.Decision]:
+# Compiled once; search_fts only binds parameters per call.
+_FTS_STMT = text(
+    "SELECT d.* FROM decisions d JOIN decisions_fts fts ON d.id = fts.rowid "
+    "WHERE fts.decisions_fts MATCH :query ORDER BY rank LIMIT :limit"
+)
+
+
+_READ_FIELDS = frozenset(DecisionRead.model_fields)
+
+
+def _read_from_fts_row(mapping: Dict[str, Any]) -> DecisionRead:
+    """Build a DecisionRead from a raw FTS row without re-hydrating the ORM.
+
+    text() rows bypass SQLAlchemy's column types, so the JSON and datetime
+    columns arrive as strings and are decoded here; everything else is
+    trusted as written and constructed without a validation pass.
+    """
+    data = dict(mapping)
+    tags = data.get("tags")
+    if isinstance(tags, (str, bytes)):
+        data["tags"] = orjson.loads(tags)
+    timestamp = data.get("timestamp")
+    if isinstance(timestamp, str):
+        data["timestamp"] = datetime.datetime.fromisoformat(timestamp)
+    return DecisionRead.model_construct(_fields_set=_READ_FIELDS, **data)
+
+
+def search_fts(db: Session, query: str, limit: int = 10) -> List[DecisionRead]:
     """Perform full-text search on decisions with fallback to basic search."""
     # This part depends on whether you have FTS tables in your migrations.
     # If this gives an error, the FTS setup in Alembic needs to be checked.
     # For now we assume that the 'decisions_fts' table exists.
     try:
-        stmt = text(
-            "SELECT d.* FROM decisions d JOIN decisions_fts fts ON d.id = fts.rowid WHERE fts.decisions_fts MATCH :query ORDER BY rank LIMIT :limit"
-        )
-        result_proxy = db.execute(stmt, {"query": query, "limit": limit})
-        return [models.Decision(**row._mapping) for row in result_proxy]
+        result_proxy = db.execute(_FTS_STMT, {"query": query, "limit": limit})
+        return [_read_from_fts_row(row._mapping) for row in result_proxy]
     except Exception:
         # Fallback if FTS is not set up
-        return (
+        rows = (
             db.query(models.Decision)
             .filter(models.Decision.summary.contains(query))
             .limit(limit)
             .all()
         )
+        return [
+            DecisionRead.model_construct(
+                id=row.id,
+                timestamp=row.timestamp,
+                summary=row.summary,
+                rationale=row.rationale,
+                implementation_details=row.implementation_details,
+                tags=row.tags or [],
+            )
+            for row in rows
+        ]
@@ -1,7 +1,30 @@
+from typing import Callable, List
+
 from sqlalchemy import event, select
 from sqlalchemy.orm import Session, attributes
 
-from ..db import models
+from ..db import database, models
+
+# Hooks fired whenever a context row is updated through the ORM, regardless
+# of which entry point (MCP tool, HTTP API) performed the write. main.py
+# registers its cache invalidation here so every writer is covered.
+_context_update_hooks: List[Callable[[str, str], None]] = []
+
+
+def on_context_update(hook: Callable[[str, str], None]) -> None:
+    """Register a callback invoked as hook(workspace_id, kind) after updates."""
+    _context_update_hooks.append(hook)
+
+
+def _notify_context_update(target, kind: str) -> None:
+    session = Session.object_session(target)
+    if not session or not _context_update_hooks:
+        return
+    workspace_id = database.workspace_id_for_engine(session.get_bind())
+    if workspace_id is None:
+        return
+    for hook in _context_update_hooks:
+        hook(workspace_id, kind)
 
 
 def _add_history(target, history_model, change_source):
@@ -27,10 +50,12 @@ def setup_history_listeners():
     @event.listens_for(models.ProductContext, "after_update")
     def receive_after_product_update(mapper, connection, target: models.ProductContext):
         _add_history(target, models.ProductContextHistory, "ProductContext Update")
+        _notify_context_update(target, "product")
 
     @event.listens_for(models.ActiveContext, "after_update")
     def receive_after_active_update(mapper, connection, target: models.ActiveContext):
         _add_history(target, models.ActiveContextHistory, "ActiveContext Update")
+        _notify_context_update(target, "active")
 
 
 setup_history_listeners()
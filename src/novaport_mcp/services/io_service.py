@@ -1,35 +1,65 @@
 import logging
+import re
+from itertools import chain
 from pathlib import Path
 from typing import Any, Dict
 
 from sqlalchemy.orm import Session
 
-from ..schemas import decision as decision_schema
 from . import decision_service
 
 logger = logging.getLogger(__name__)
 
+# One block per exported decision: a "## <summary>" heading followed by
+# everything up to the next heading or "---" separator. Compiled once so
+# imports do a single scan over the file instead of re-splitting each block.
+_DECISION_BLOCK_RE = re.compile(
+    r"^#{2,}[ \t]*(?P<summary>.+?)[ \t]*$"
+    r"(?P<body>.*?)"
+    r"(?=^#{2,}[ \t]|^---|\Z)",
+    re.MULTILINE | re.DOTALL,
+)
+_RATIONALE_RE = re.compile(
+    r"\*\*Rationale:\*\*(?P<rationale>.*?)(?=\*\*|\Z)", re.DOTALL
+)
+
+
+_EXPORT_HEADER = "# Decision Log\n\n"
+_EXPORT_SEPARATOR = "---\n"
+# 128 KiB write buffer: exports emit many small fragments, and the default
+# block-sized buffer turns them into a syscall-heavy write pattern.
+_EXPORT_BUFFER_SIZE = 1 << 17
+
 
 def export_to_markdown(db: Session, export_path: Path) -> Dict[str, Any]:
     export_path.mkdir(parents=True, exist_ok=True)
     files_created = []
-    # Decisions
-    decisions = decision_service.get_multi(db, limit=1000)
-    if decisions:
-        with open(export_path / "decisions.md", "w", encoding="utf-8") as f:
-            f.write("# Decision Log\n\n")
-            for d in decisions:
-                f.write(f"## {d.summary}\n\n**Timestamp:** {d.timestamp}\n\n")
+    # Decisions are streamed in batches rather than loaded as one list, so
+    # exports stay bounded in memory and are no longer capped at 1000 rows.
+    # Peek at the first row to keep the old "no file when empty" behavior.
+    decisions = decision_service.iter_all(db)
+    first = next(decisions, None)
+    if first is not None:
+        with open(
+            export_path / "decisions.md",
+            "w",
+            encoding="utf-8",
+            buffering=_EXPORT_BUFFER_SIZE,
+        ) as f:
+            f.write(_EXPORT_HEADER)
+            for d in chain((first,), decisions):
+                parts = [f"## {d.summary}\n\n**Timestamp:** {d.timestamp}\n\n"]
                 if d.rationale is not None:
-                    f.write(f"**Rationale:**\n{d.rationale}\n\n")
+                    parts.append(f"**Rationale:**\n{d.rationale}\n\n")
                 if d.implementation_details is not None:
-                    f.write(
+                    parts.append(
                         f"**Implementation Details:**\n"
                         f"{d.implementation_details}\n\n"
                     )
                 if isinstance(d.tags, list) and len(d.tags) > 0:
-                    f.write(f"**Tags:** {', '.join(d.tags)}\n\n")
-                f.write("---\n")
+                    parts.append(f"**Tags:** {', '.join(d.tags)}\n\n")
+                parts.append(_EXPORT_SEPARATOR)
+                f.write("".join(parts))
         files_created.append("decisions.md")
     # Add logic here to export other entities
     return {
@@ -48,39 +78,27 @@ def import_from_markdown(
     with open(import_path / "decisions.md", "r", encoding="utf-8") as f:
         content = f.read()
 
-    decision_blocks = content.split("---")
     imported_count = 0
     failed_count = 0
 
-    for block in decision_blocks:
-        if not block.strip() or "##" not in block:
+    for match in _DECISION_BLOCK_RE.finditer(content):
+        summary = match.group("summary")
+        if not summary:
             continue
         try:
-            # Find the line that contains the ## header
-            lines = block.strip().split("\n")
-            summary = None
-            for line in lines:
-                line = line.strip()
-                if line.startswith("##"):
-                    summary = line.replace("##", "").strip()
-                    break
-
-            if not summary:
-                continue  # Skip if no proper header found
-
             rationale = None
-            if "**Rationale:**" in block:
-                rationale = block.split("**Rationale:**")[1].split("**")[0].strip()
+            rationale_match = _RATIONALE_RE.search(match.group("body"))
+            if rationale_match:
+                rationale = rationale_match.group("rationale").strip()
 
-            decision_data = decision_schema.DecisionCreate(
-                summary=summary, rationale=rationale
+            decision_service.create(
+                db, workspace_id, summary=summary, rationale=rationale
             )
-            decision_service.create(db, workspace_id, decision_data)
             imported_count += 1
         except Exception as e:
             logger.warning(
                 f"Failed to parse decision block starting with: "
-                f"{block[:50]}... Error: {str(e)}"
+                f"{match.group(0)[:50]}... Error: {str(e)}"
             )
             failed_count += 1
             continue
@@ -6,12 +6,19 @@ from sqlalchemy.orm import Session
 from ..db import models
 from ..schemas import link as link_schema
 
+# get_for_item results are memoized on the session itself (db.info is
+# SQLAlchemy's per-session scratch dict), so flows that fan out links per
+# item within one request skip the repeated OR query but nothing outlives
+# the session - no staleness across requests or workspaces.
+_CACHE_INFO_KEY = "link_get_for_item_cache"
+
 
 def create(db: Session, link: link_schema.LinkCreate) -> models.ContextLink:
     db_link = models.ContextLink(**link.model_dump())
     db.add(db_link)
     db.commit()
     db.refresh(db_link)
+    db.info.pop(_CACHE_INFO_KEY, None)
     return db_link
 
 
@@ -19,7 +26,11 @@ def get_for_item(
     db: Session, item_type: str, item_id: str, limit: int = 50
 ) -> List[models.ContextLink]:
     item_id_str = str(item_id)
-    return (
+    cache = db.info.setdefault(_CACHE_INFO_KEY, {})
+    cache_key = (item_type, item_id_str, limit)
+    if cache_key in cache:
+        return cache[cache_key]
+    links = (
         db.query(models.ContextLink)
         .filter(
             or_(
@@ -32,3 +43,5 @@ def get_for_item(
         .limit(limit)
         .all()
     )
+    cache[cache_key] = links
+    return links
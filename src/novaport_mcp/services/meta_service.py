@@ -1,75 +1,179 @@
 import datetime
-from typing import Any, Callable, Dict, List, Optional, cast
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, cast
 
+import orjson
 from pydantic import ValidationError
+from sqlalchemy import insert, text
 from sqlalchemy.orm import Session
 
+from ..db import models
 from ..schemas.custom_data import CustomDataCreate
 from ..schemas.decision import DecisionCreate
 from ..schemas.progress import ProgressEntryCreate
 from ..schemas.system_pattern import SystemPatternCreate
-from . import (
-    custom_data_service,
-    decision_service,
-    progress_service,
-    system_pattern_service,
+from . import custom_data_service, progress_service, vector_service
+
+# Decisions and system patterns are flat rows, so both per-type LIMITs can be
+# fetched in a single UNION ALL round-trip with the row packed as JSON.
+# Progress entries keep their ORM query because of the nested children.
+_RECENT_ACTIVITY_STMT = (
+    "SELECT 'decision' AS kind, json_object("
+    "'id', id, 'timestamp', timestamp, 'summary', summary, "
+    "'rationale', rationale, "
+    "'implementation_details', implementation_details, "
+    "'tags', json(tags)) AS payload "
+    "FROM (SELECT * FROM decisions{where} "
+    "ORDER BY timestamp DESC LIMIT :limit) "
+    "UNION ALL "
+    "SELECT 'system_pattern', json_object("
+    "'id', id, 'timestamp', timestamp, 'name', name, "
+    "'description', description, 'tags', json(tags)) "
+    "FROM (SELECT * FROM system_patterns{where} "
+    "ORDER BY timestamp DESC LIMIT :limit)"
 )
 
 
 def get_recent_activity(
     db: Session, limit: int = 5, since: Optional[datetime.datetime] = None
 ) -> Dict[str, List[Any]]:
+    """Return the most recent decisions, progress entries and patterns."""
+    params: Dict[str, Any] = {"limit": limit}
+    where = ""
+    if since is not None:
+        where = " WHERE timestamp >= :since"
+        params["since"] = since
+    stmt = text(_RECENT_ACTIVITY_STMT.format(where=where))
+
+    decisions: List[Any] = []
+    system_patterns: List[Any] = []
+    for kind, payload in db.execute(stmt, params):
+        (decisions if kind == "decision" else system_patterns).append(
+            orjson.loads(payload)
+        )
+
     return {
-        "decisions": decision_service.get_multi(db, limit=limit, since=since),
+        "decisions": decisions,
         "progress": progress_service.get_multi(db, limit=limit, since=since),
-        "system_patterns": system_pattern_service.get_multi(
-            db, limit=limit, since=since
-        ),
+        "system_patterns": system_patterns,
     }
 
 
-def batch_log_items(
-    db: Session, workspace_id: str, item_type: str, items: List[Dict[str, Any]]
-) -> Dict[str, Any]:
-    # Define the service function, the Pydantic schema, and the correct keyword argument name
-    service_map = {
-        "decision": (decision_service.create, DecisionCreate, "decision"),
-        "progress": (progress_service.create, ProgressEntryCreate, "entry"),
-        "system_pattern": (
-            system_pattern_service.create,
-            SystemPatternCreate,
-            "pattern",
-        ),
-        "custom_data": (custom_data_service.upsert, CustomDataCreate, "data"),
+def _decision_embedding(item: DecisionCreate) -> Tuple[str, Dict[str, Any]]:
+    text_to_embed = f"Decision: {item.summary}\nRationale: {item.rationale or ''}"
+    metadata = {
+        "item_type": "decision",
+        "summary": item.summary,
+        "tags": item.tags or [],
     }
+    return text_to_embed, metadata
 
-    if item_type not in service_map:
-        raise ValueError(f"Invalid item_type for batch operation: {item_type}")
 
-    service_func, schema, param_name = service_map[item_type]
-    service_func = cast(Callable[..., Any], service_func)
-    success_count, errors = 0, []
+def _system_pattern_embedding(
+    item: SystemPatternCreate,
+) -> Tuple[str, Dict[str, Any]]:
+    text_to_embed = (
+        f"System Pattern: {item.name}\nDescription: {item.description or ''}"
+    )
+    metadata = {
+        "item_type": "system_pattern",
+        "name": item.name,
+        "tags": item.tags or [],
+    }
+    return text_to_embed, metadata
+
+
+# Flat item types are bulk-inserted with one executemany statement; progress
+# and custom_data keep per-item service calls because of their extra logic
+# (parent links, upsert semantics).
+_BULK_INSERT_MAP = {
+    "decision": (models.Decision, DecisionCreate, _decision_embedding, "decision_"),
+    "system_pattern": (
+        models.SystemPattern,
+        SystemPatternCreate,
+        _system_pattern_embedding,
+        "system_pattern_",
+    ),
+}
+
+# Progress and custom_data keep their service logic (parent links, upsert
+# semantics) but batch through *_many entry points: one transaction and one
+# embedding batch per call instead of a commit and model call per item.
+# Resolved to the live module attribute per call, so the functions can be
+# monkeypatched like any other service entry point.
+_SERVICE_MAP = {
+    "progress": (progress_service, "create_many", ProgressEntryCreate),
+    "custom_data": (custom_data_service, "upsert_many", CustomDataCreate),
+}
+
 
+def _bulk_insert_items(
+    db: Session, workspace_id: str, item_type: str, items: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Insert flat items with one executemany statement, then embed them."""
+    model, schema, embedding_payload, id_prefix = _BULK_INSERT_MAP[item_type]
+    errors = []
+    validated: List[Any] = []
     for item_data in items:
         try:
-            validated_item = schema(**item_data)
+            validated.append(schema(**item_data))
+        except (ValidationError, TypeError) as e:
+            errors.append({"item": item_data, "error": str(e)})
+    if validated:
+        rows = []
+        texts: List[str] = []
+        metadatas: List[Dict[str, Any]] = []
+        for item in validated:
+            row = item.model_dump()
+            row["tags"] = row.get("tags") or []
+            rows.append(row)
+            text_to_embed, metadata = embedding_payload(item)
+            texts.append(text_to_embed)
+            metadatas.append(metadata)
+        # The batched encode only needs the texts, so it runs in a worker
+        # thread (torch releases the GIL) while the insert commits; wall
+        # time is max(db, embed) instead of their sum.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            embed_future = executor.submit(
+                vector_service.generate_embeddings_batch, texts
+            )
+            # sort_by_parameter_order keeps the RETURNING ids aligned with
+            # the submitted rows; without it the zip with texts/metadatas
+            # below is only correct by accident of the backend.
+            result = db.execute(
+                insert(model).returning(model.id, sort_by_parameter_order=True),
+                rows,
+            )
+            new_ids = result.scalars().all()
+            db.commit()
+            embeddings = embed_future.result()
+        item_ids = [f"{id_prefix}{new_id}" for new_id in new_ids]
+        vector_service.upsert_embeddings_bulk(
+            workspace_id, item_ids, texts, metadatas, embeddings=embeddings
+        )
+    return {"succeeded": len(validated), "failed": len(errors), "details": errors}
 
-            kwargs = {
-                "db": db,
-                "workspace_id": workspace_id,
-                param_name: validated_item,
-            }
 
-            # Progress has a special signature that we must respect
-            if item_type == "progress":
-                kwargs["linked_item_type"] = None
-                kwargs["linked_item_id"] = None
-                kwargs["link_relationship_type"] = "relates_to_progress"
+def batch_log_items(
+    db: Session, workspace_id: str, item_type: str, items: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Log a batch of items of one type, reporting per-item failures."""
+    if item_type not in _BULK_INSERT_MAP and item_type not in _SERVICE_MAP:
+        raise ValueError(f"Invalid item_type for batch operation: {item_type}")
+
+    if item_type in _BULK_INSERT_MAP:
+        return _bulk_insert_items(db, workspace_id, item_type, items)
 
-            service_func(**kwargs)
+    service_module, func_name, schema = _SERVICE_MAP[item_type]
+    service_func = cast(Callable[..., Any], getattr(service_module, func_name))
 
-            success_count += 1
+    validated, errors = [], []
+    for item_data in items:
+        try:
+            validated.append(schema(**item_data))
         except (ValidationError, TypeError) as e:
             errors.append({"item": item_data, "error": str(e)})
+    if validated:
+        service_func(db, workspace_id, validated)
 
-    return {"succeeded": success_count, "failed": len(errors), "details": errors}
+    return {"succeeded": len(validated), "failed": len(errors), "details": errors}
@@ -1,4 +1,5 @@
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 
 from sqlalchemy.orm import Session
@@ -12,26 +13,34 @@ from . import link_service, vector_service
 def create(
     db: Session,
     workspace_id: str,
-    entry: progress_schema.ProgressEntryCreate,
-    linked_item_type: Optional[str],
-    linked_item_id: Optional[str],
-    link_relationship_type: str,
+    *,
+    status: str,
+    description: str,
+    parent_id: Optional[int] = None,
+    linked_item_type: Optional[str] = None,
+    linked_item_id: Optional[str] = None,
+    link_relationship_type: str = "relates_to_progress",
 ) -> models.ProgressEntry:
-    db_entry = models.ProgressEntry(**entry.model_dump())
+    db_entry = models.ProgressEntry(
+        status=status, description=description, parent_id=parent_id
+    )
     db.add(db_entry)
+    # flush() assigns the PK and the client-side timestamp default, so no
+    # refresh SELECT is needed after the commit.
+    db.flush()
+    entry_id = db_entry.id
     db.commit()
-    db.refresh(db_entry)
 
-    text = f"Progress {db_entry.status}: {db_entry.description}"
-    metadata = {"item_type": "progress", "status": db_entry.status}
+    text = f"Progress {status}: {description}"
+    metadata = {"item_type": "progress", "status": status}
     vector_service.upsert_embedding(
-        workspace_id, f"progress_{db_entry.id}", text, metadata
+        workspace_id, f"progress_{entry_id}", text, metadata
     )
 
     if linked_item_type and linked_item_id:
         link_data = link_schema.LinkCreate(
             source_item_type="progress_entry",
-            source_item_id=str(db_entry.id),
+            source_item_id=str(entry_id),
             target_item_type=linked_item_type,
             target_item_id=str(linked_item_id),
             relationship_type=link_relationship_type,
@@ -41,6 +50,43 @@ def create(
     return db_entry
 
 
+def create_many(
+    db: Session,
+    workspace_id: str,
+    entries: List[progress_schema.ProgressEntryCreate],
+) -> List[models.ProgressEntry]:
+    """Create many progress entries with one commit and one embedding batch.
+
+    Used by the batch tool: one flush assigns all IDs, one commit pays a
+    single fsync, and the embeddings go through one batched encode instead
+    of a model call per entry.
+    """
+    db_entries = [
+        models.ProgressEntry(
+            status=e.status, description=e.description, parent_id=e.parent_id
+        )
+        for e in entries
+    ]
+    texts = [f"Progress {e.status}: {e.description}" for e in entries]
+    metadatas = [{"item_type": "progress", "status": e.status} for e in entries]
+    # Encode in a worker thread while the insert commits; the texts don't
+    # depend on the assigned IDs, so the two can overlap.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        embed_future = executor.submit(
+            vector_service.generate_embeddings_batch, texts
+        )
+        db.add_all(db_entries)
+        db.flush()
+        db.commit()
+        embeddings = embed_future.result()
+
+    item_ids = [f"progress_{db_entry.id}" for db_entry in db_entries]
+    vector_service.upsert_embeddings_bulk(
+        workspace_id, item_ids, texts, metadatas, embeddings=embeddings
+    )
+    return db_entries
+
+
 def get(db: Session, entry_id: int) -> models.ProgressEntry | None:
     return (
         db.query(models.ProgressEntry)
@@ -1,33 +1,41 @@
 import datetime
 from typing import List, Optional
 
-from sqlalchemy import or_
+from sqlalchemy import and_, or_
 from sqlalchemy.orm import Session
 
 from ..db import models
-from ..schemas import system_pattern as sp_schema
 from . import vector_service
 
 
 def create(
-    db: Session, workspace_id: str, pattern: sp_schema.SystemPatternCreate
+    db: Session,
+    workspace_id: str,
+    *,
+    name: str,
+    description: Optional[str] = None,
+    tags: Optional[List[str]] = None,
 ) -> models.SystemPattern:
     """Creates a new system pattern and its vector embedding."""
-    db_pattern = models.SystemPattern(**pattern.model_dump())
+    tags_list: List[str] = tags or []
+    db_pattern = models.SystemPattern(
+        name=name, description=description, tags=tags_list
+    )
     db.add(db_pattern)
+    # flush() assigns the PK and the client-side timestamp default, so no
+    # refresh SELECT is needed after the commit.
+    db.flush()
+    pattern_id = db_pattern.id
     db.commit()
-    db.refresh(db_pattern)
 
-    text_to_embed = f"System Pattern: {db_pattern.name}\nDescription: {db_pattern.description or ''}"
-    db_tags = db_pattern.tags
-    tags_list: List[str] = db_tags if isinstance(db_tags, list) else []
+    text_to_embed = f"System Pattern: {name}\nDescription: {description or ''}"
     metadata = {
         "item_type": "system_pattern",
-        "name": db_pattern.name,
+        "name": name,
         "tags": tags_list,
     }
     vector_service.upsert_embedding(
-        workspace_id, f"system_pattern_{db_pattern.id}", text_to_embed, metadata
+        workspace_id, f"system_pattern_{pattern_id}", text_to_embed, metadata
     )
 
     return db_pattern
@@ -54,8 +62,10 @@ def get_multi(
     query = db.query(models.SystemPattern)
 
     if tags_all:
-        for tag in tags_all:
-            query = query.filter(models.SystemPattern.tags.like(f'%"{tag}"%'))
+        # One combined predicate instead of chaining a filter() per tag.
+        query = query.filter(
+            and_(*(models.SystemPattern.tags.like(f'%"{tag}"%') for tag in tags_all))
+        )
     if tags_any:
         filters = [models.SystemPattern.tags.like(f'%"{tag}"%') for tag in tags_any]
         query = query.filter(or_(*filters))
@@ -1,6 +1,9 @@
 import logging
+import sys
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, List, Optional, Tuple, cast
 
 import chromadb
 from chromadb.api.client import Client
@@ -12,6 +15,7 @@ from ..core import config as core_config
 log = logging.getLogger(__name__)
 
 _model: Optional[SentenceTransformer] = None
+_model_lock = threading.Lock()
 _chroma_clients: Dict[str, Client] = {}
 _collections: Dict[str, chromadb.Collection] = {}
 
@@ -19,18 +23,49 @@ _collections: Dict[str, chromadb.Collection] = {}
 def get_embedding_model() -> SentenceTransformer:
     global _model
     if _model is None:
-        log.info(
-            f"Loading sentence transformer model: {core_config.settings.EMBEDDING_MODEL_NAME}..."
-        )
-        _model = SentenceTransformer(core_config.settings.EMBEDDING_MODEL_NAME)
-        log.info("Embedding model loaded.")
+        # Double-checked locking: the warmup thread and the first request can
+        # race here, and the load takes seconds, so a late caller should wait
+        # for the in-flight load instead of starting a second one.
+        with _model_lock:
+            if _model is None:
+                log.info(
+                    f"Loading sentence transformer model: {core_config.settings.EMBEDDING_MODEL_NAME}..."
+                )
+                threads = core_config.settings.EMBEDDING_THREADS
+                if threads:
+                    import torch
+
+                    torch.set_num_threads(threads)
+                _model = SentenceTransformer(
+                    core_config.settings.EMBEDDING_MODEL_NAME,
+                    backend=core_config.settings.EMBEDDING_BACKEND,
+                )
+                log.info("Embedding model loaded.")
     return _model
 
 
+def warmup_embedding_model() -> threading.Thread:
+    """Start loading the embedding model in a background thread.
+
+    Called by the server entry point so the multi-second model load happens
+    during startup instead of stalling the first tool call that needs an
+    embedding. Lazy loading via get_embedding_model() still works when the
+    warmup was never started (e.g. in tests or library use).
+    """
+    thread = threading.Thread(
+        target=get_embedding_model, name="embedding-model-warmup", daemon=True
+    )
+    thread.start()
+    return thread
+
+
 # Constants for cleanup delays
 CHROMA_CLEANUP_DELAY = 2.0
 CHROMA_GC_DELAY = 0.5
 
+# Bulk upserts are split into chunks in Chroma's recommended batch range.
+_CHROMA_UPSERT_CHUNK = 250
+
 
 def cleanup_chroma_client(workspace_id: str) -> None:
     """Closes the ChromaDB client for a specific workspace."""
@@ -55,10 +90,9 @@ def cleanup_chroma_client(workspace_id: str) -> None:
                     f"Cleaning up collection: {collection_name} (type: {type(collection_name)})"
                 )
 
-                # Delete all documents first
-                if collection.count() > 0:
-                    collection.delete(ids=collection.get()["ids"])
-                # Then delete the collection itself
+                # Dropping the collection wipes its documents server-side;
+                # fetching every id into Python just to hand them back to
+                # Chroma for deletion was an O(N) round-trip for nothing.
                 client.delete_collection(name=collection_name)
 
             # Reset and close the client
@@ -71,22 +105,22 @@ def cleanup_chroma_client(workspace_id: str) -> None:
             ]
             for key in keys_to_remove:
                 del _collections[key]
+                _search_ef_applied.pop(key, None)
                 log.debug(f"Removed collection from cache: {key}")
             log.info(
                 f"Selectively removed {len(keys_to_remove)} collection(s) from cache for workspace: {workspace_id}"
             )
 
-            import time
-
-            time.sleep(
-                CHROMA_CLEANUP_DELAY
-            )  # Give Windows more time to release handles
-
-            # Force garbage collection to free resources
-            import gc
+            # Only Windows needs the grace period: open handles there keep
+            # the deleted SQLite files pinned. Elsewhere the sleeps and the
+            # forced collection just serialize teardown for no benefit.
+            if sys.platform == "win32":
+                import gc
+                import time
 
-            gc.collect()
-            time.sleep(CHROMA_GC_DELAY)  # Extra wait time after garbage collection
+                time.sleep(CHROMA_CLEANUP_DELAY)  # Let Windows release handles
+                gc.collect()
+                time.sleep(CHROMA_GC_DELAY)  # Extra wait after collection
 
             del _chroma_clients[db_path]
             log.info(
@@ -131,18 +165,12 @@ def get_collection(
     cache_key = f"{workspace_id}_{collection_name}"
 
     try:
-        # Try from cache first
-        if cache_key in _collections:
-            try:
-                # Test if the cached collection is still valid by calling the count() method
-                _collections[cache_key].count()
-                return _collections[cache_key]
-            except Exception:
-                # If the collection is invalid, remove from cache
-                log.warning(
-                    f"Invalid collection in cache for {cache_key}, will be recreated"
-                )
-                _collections.pop(cache_key, None)
+        # Cache hits are trusted: cleanup_chroma_client evicts a workspace's
+        # entries whenever it resets the client, so probing validity with a
+        # count() aggregate on every call was a wasted SQL round-trip.
+        cached = _collections.get(cache_key)
+        if cached is not None:
+            return cached
 
         # If we get here, we need to create a new collection
         client = get_chroma_client(workspace_id)
@@ -158,7 +186,21 @@ def get_collection(
             log.info(
                 f"Collection '{collection_name}' not found for {workspace_id}, creating: {str(e)}"
             )
-            collection = client.create_collection(name=collection_name)
+            # New collections get tuned HNSW parameters; the distance space
+            # stays at Chroma's default so old and new collections report
+            # comparable distances.
+            collection = client.create_collection(
+                name=collection_name,
+                configuration={
+                    "hnsw": {
+                        "max_neighbors": core_config.settings.CHROMA_HNSW_MAX_NEIGHBORS,
+                        "ef_construction": (
+                            core_config.settings.CHROMA_HNSW_EF_CONSTRUCTION
+                        ),
+                        "ef_search": core_config.settings.CHROMA_HNSW_EF_SEARCH,
+                    }
+                },
+            )
 
         # Update the cache only if we have a working collection
         _collections[cache_key] = collection
@@ -174,18 +216,82 @@ def generate_embedding(text: str) -> List[float]:
     return model.encode(text, convert_to_tensor=False).tolist()
 
 
+@lru_cache(maxsize=256)
+def _cached_query_embedding(query_text: str) -> Tuple[float, ...]:
+    """Memoize recent query embeddings.
+
+    Dashboards and chat UIs re-issue identical searches (pagination, filter
+    tweaks), and the embedding for a given text is deterministic for the
+    loaded model, so repeats skip the encode entirely.
+    """
+    return tuple(generate_embedding(query_text))
+
+
+def generate_embeddings_batch(texts: List[str]) -> List[List[float]]:
+    """Encode many texts in one call.
+
+    Amortizes tokenization and batches the matrix multiplications instead
+    of paying the per-text encode overhead once per item.
+    """
+    model = get_embedding_model()
+    return model.encode(texts, batch_size=64, convert_to_numpy=True).tolist()
+
+
+def _safe_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    # Metadata is usually already scalar-only; reuse it and only pay for a
+    # filtered copy when a non-scalar value is actually present.
+    if all(isinstance(v, (str, int, float, bool)) for v in metadata.values()):
+        return metadata
+    return {
+        k: v for k, v in metadata.items() if isinstance(v, (str, int, float, bool))
+    }
+
+
 def upsert_embedding(
     workspace_id: str, item_id: str, text_to_embed: str, metadata: Dict[str, Any]
 ) -> None:
     collection = get_collection(workspace_id)
     embedding = generate_embedding(text_to_embed)
-    safe_metadata = {
-        k: v for k, v in metadata.items() if isinstance(v, (str, int, float, bool))
-    }
-    collection.upsert(ids=[item_id], embeddings=[embedding], metadatas=[safe_metadata])  # type: ignore
+    collection.upsert(
+        ids=[item_id],
+        embeddings=[embedding],  # type: ignore
+        metadatas=[_safe_metadata(metadata)],  # type: ignore
+    )
     log.info(f"Upserted embedding for item {item_id} in workspace {workspace_id}")
 
 
+def upsert_embeddings_bulk(
+    workspace_id: str,
+    item_ids: List[str],
+    texts_to_embed: List[str],
+    metadatas: List[Dict[str, Any]],
+    embeddings: Optional[List[List[float]]] = None,
+) -> None:
+    """Upsert many embeddings with one batched encode and one Chroma call.
+
+    Callers that already encoded the texts (e.g. overlapped with a DB write)
+    can pass the vectors via ``embeddings`` to skip the encode here.
+    """
+    if not item_ids:
+        return
+    collection = get_collection(workspace_id)
+    if embeddings is None:
+        embeddings = generate_embeddings_batch(texts_to_embed)
+    safe_metadatas = [_safe_metadata(m) for m in metadatas]
+    # Chroma indexes best in moderate batches; very large imports are
+    # split so no single upsert turns into one huge sqlite transaction.
+    for start in range(0, len(item_ids), _CHROMA_UPSERT_CHUNK):
+        end = start + _CHROMA_UPSERT_CHUNK
+        collection.upsert(
+            ids=item_ids[start:end],
+            embeddings=embeddings[start:end],  # type: ignore
+            metadatas=safe_metadatas[start:end],  # type: ignore
+        )
+    log.info(
+        f"Upserted {len(item_ids)} embeddings in bulk for workspace {workspace_id}"
+    )
+
+
 def delete_embedding(workspace_id: str, item_id: str) -> None:
     collection = get_collection(workspace_id)
     try:
@@ -197,6 +303,40 @@ def delete_embedding(workspace_id: str, item_id: str) -> None:
         )
 
 
+# ef_search actually applied per collection cache key, so search() only
+# issues a modify() when the adaptive value changes. Guarded by a lock
+# because collections are shared across requests.
+_search_ef_applied: Dict[str, int] = {}
+_search_ef_lock = threading.Lock()
+
+
+def _adaptive_search_ef(top_k: int) -> int:
+    """Scale the HNSW ef_search knob with the requested top_k.
+
+    Small result sets don't need a deep candidate search, large ones do;
+    clamped so recall never drops below the small-query floor.
+    """
+    return min(max(top_k * 4, 40), 400)
+
+
+def _apply_search_ef(
+    workspace_id: str, collection: chromadb.Collection, top_k: int
+) -> None:
+    ef = _adaptive_search_ef(top_k)
+    key = f"{workspace_id}_{collection.name}"
+    with _search_ef_lock:
+        if _search_ef_applied.get(key) == ef:
+            return
+        try:
+            collection.modify(configuration={"hnsw": {"ef_search": ef}})
+            _search_ef_applied[key] = ef
+        except Exception as e:
+            # Query proceeds with whatever ef the collection already has,
+            # but a server that can never modify would otherwise degrade
+            # silently - keep this visible in normal logs.
+            log.warning(f"Could not adjust ef_search for {key}: {e}")
+
+
 def search(
     workspace_id: str,
     query_text: str,
@@ -204,7 +344,8 @@ def search(
     filters: Optional[Dict[str, Any]] = None,
 ) -> List[Dict[str, Any]]:
     collection = get_collection(workspace_id)
-    query_embedding = generate_embedding(query_text)
+    _apply_search_ef(workspace_id, collection, top_k)
+    query_embedding = list(_cached_query_embedding(query_text))
     results = collection.query(query_embeddings=[query_embedding], n_results=top_k, where=filters)  # type: ignore
 
     output = []
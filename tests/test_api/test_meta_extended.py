@@ -403,7 +403,7 @@ class TestTimestampFiltering:
         assert isinstance(result, dict)
         assert "decisions" in result
         assert len(result["decisions"]) == 1
-        assert result["decisions"][0].summary == "Recent decision"
+        assert result["decisions"][0]["summary"] == "Recent decision"
 
     def test_get_recent_activity_with_since_endpoint(
         self, client: TestClient, db_session
@@ -626,13 +626,13 @@ class TestTimestampFiltering:
 
         # Should only get recent items
         assert len(result["decisions"]) == 1
-        assert result["decisions"][0].summary == "Recent decision"
+        assert result["decisions"][0]["summary"] == "Recent decision"
 
         assert len(result["progress"]) == 1
         assert result["progress"][0].description == "Recent progress"
 
         assert len(result["system_patterns"]) == 1
-        assert result["system_patterns"][0].name == "Recent Pattern"
+        assert result["system_patterns"][0]["name"] == "Recent Pattern"
 
     def test_timestamp_filtering_boundary_conditions(self, db_session):
         """Test timestamp filtering boundary conditions."""
@@ -664,7 +664,7 @@ class TestTimestampFiltering:
 
         # Should include items at or after cutoff time
         assert len(result["decisions"]) == 2
-        summaries = [d.summary for d in result["decisions"]]
+        summaries = [d["summary"] for d in result["decisions"]]
         assert "At cutoff" in summaries
         assert "After cutoff" in summaries
         assert "Before cutoff" not in summaries
@@ -700,5 +700,7 @@ class TestTimestampFiltering:
 
         # All returned items should be after cutoff
         for decision in result["decisions"]:
-            assert decision.timestamp >= cutoff_time
+            assert (
+                datetime.datetime.fromisoformat(decision["timestamp"]) >= cutoff_time
+            )
         assert len(result["system_patterns"]) == 0
\ No newline at end of file
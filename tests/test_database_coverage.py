@@ -82,13 +82,16 @@ class TestDatabaseSessionManagement:
                         
                         # Verify calls
                         mock_create_engine.assert_called_once_with(
-                            "sqlite:///test.db", 
-                            connect_args={"check_same_thread": False}
+                            "sqlite:///test.db",
+                            connect_args={"check_same_thread": False},
+                            json_serializer=database._json_serializer,
+                            json_deserializer=database.orjson.loads
                         )
                         mock_to_thread.assert_called_once()
                         mock_sessionmaker.assert_called_once_with(
-                            autocommit=False, 
-                            autoflush=False, 
+                            autocommit=False,
+                            autoflush=False,
+                            expire_on_commit=False,
                             bind=mock_engine
                         )
 
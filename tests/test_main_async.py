@@ -1,5 +1,7 @@
 """Tests voor main CLI module functies - async versie."""
 
+import json
+
 import pytest
 import pytest_asyncio
 from unittest.mock import Mock, patch, AsyncMock
@@ -134,10 +136,11 @@ class TestMainAsyncCLIFunctions:
         """Test get_decisions async function."""
         from datetime import datetime
 
-        with patch('src.novaport_mcp.main.decision_service.get_multi') as mock_get:
+        with patch('src.novaport_mcp.main.decision_service.get_multi_json') as mock_get:
             mock_decision = {"id": 1, "summary": "Decision 1", "rationale": None,
-                             "implementation_details": None, "tags": [], "timestamp": datetime.now()}
-            mock_get.return_value = [mock_decision]
+                             "implementation_details": None, "tags": [],
+                             "timestamp": datetime.now().isoformat()}
+            mock_get.return_value = json.dumps([mock_decision])
 
             token = main.db_session_context.set(mock_db_session)
             result = await main.get_decisions(workspace_id=workspace_id)
@@ -340,4 +343,172 @@ class TestMainAsyncErrorHandling:
         
         result = await dummy_func()
         assert isinstance(result, MCPError)
-        assert "workspace_id is a required argument." in result.error
\ No newline at end of file
+        assert "workspace_id is a required argument." in result.error
+
+class TestReadCaches:
+    """Tests for the TTL read cache and the context content cache."""
+
+    @pytest.fixture(autouse=True)
+    def clear_caches(self):
+        """Start every test with empty caches."""
+        main._read_cache.clear()
+        main._context_cache.clear()
+        main._context_versions.clear()
+        yield
+        main._read_cache.clear()
+        main._context_cache.clear()
+        main._context_versions.clear()
+
+    @pytest.mark.asyncio
+    async def test_search_decisions_fts_served_from_ttl_cache(self, tmp_path):
+        """A repeated identical read within the TTL hits the cache, not the service."""
+        workspace_id = str(tmp_path)
+        with patch('src.novaport_mcp.main.decision_service.search_fts') as mock_search:
+            mock_search.return_value = []
+
+            first = await main.search_decisions_fts(
+                workspace_id=workspace_id, query_term="auth"
+            )
+            second = await main.search_decisions_fts(
+                workspace_id=workspace_id, query_term="auth"
+            )
+
+            assert first == second == []
+            assert mock_search.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidation_evicts_cached_reads(self, tmp_path):
+        """Invalidation for an entity forces the next read back to the service."""
+        workspace_id = str(tmp_path)
+        with patch('src.novaport_mcp.main.decision_service.search_fts') as mock_search:
+            mock_search.return_value = []
+
+            await main.search_decisions_fts(
+                workspace_id=workspace_id, query_term="auth"
+            )
+            main._invalidate_read_cache("decisions")
+            await main.search_decisions_fts(
+                workspace_id=workspace_id, query_term="auth"
+            )
+
+            assert mock_search.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_not_served(self, tmp_path):
+        """Entries older than the TTL are recomputed."""
+        workspace_id = str(tmp_path)
+        with patch('src.novaport_mcp.main.decision_service.search_fts') as mock_search:
+            mock_search.return_value = []
+
+            await main.search_decisions_fts(
+                workspace_id=workspace_id, query_term="auth"
+            )
+            with patch.object(main, '_READ_CACHE_TTL_SECONDS', -1.0):
+                await main.search_decisions_fts(
+                    workspace_id=workspace_id, query_term="auth"
+                )
+
+            assert mock_search.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_product_context_cache_hit_and_version_bump(self, tmp_path):
+        """Cached context is served until the version is bumped."""
+        workspace_id = str(tmp_path)
+        with patch(
+            'src.novaport_mcp.main.context_service.get_product_context'
+        ) as mock_get:
+            mock_context = Mock()
+            mock_context.content = {"goal": "v1"}
+            mock_get.return_value = mock_context
+
+            first = await main.get_product_context(workspace_id=workspace_id)
+            second = await main.get_product_context(workspace_id=workspace_id)
+            assert first == second == {"goal": "v1"}
+            assert mock_get.call_count == 1
+
+            # Any writer (MCP tool or HTTP API) bumps the version through the
+            # history listener; the next read must go back to the database.
+            main._bump_context_version(workspace_id, "product")
+            mock_context.content = {"goal": "v2"}
+            third = await main.get_product_context(workspace_id=workspace_id)
+            assert third == {"goal": "v2"}
+            assert mock_get.call_count == 2
+
+
+class TestBatchRead:
+    """Tests for the batch_read dispatch tool."""
+
+    @pytest.fixture(autouse=True)
+    def clear_caches(self):
+        """Keep the read caches from leaking between tests."""
+        main._read_cache.clear()
+        main._context_cache.clear()
+        main._context_versions.clear()
+        yield
+        main._read_cache.clear()
+        main._context_cache.clear()
+        main._context_versions.clear()
+
+    @pytest.mark.asyncio
+    async def test_dispatches_multiple_reads(self, tmp_path):
+        """Each operation runs and reports its own indexed result."""
+        workspace_id = str(tmp_path)
+        with patch(
+            'src.novaport_mcp.main.context_service.get_product_context'
+        ) as mock_ctx, patch(
+            'src.novaport_mcp.main.decision_service.get_multi_json'
+        ) as mock_decisions:
+            mock_context = Mock()
+            mock_context.content = {"goal": "Test"}
+            mock_ctx.return_value = mock_context
+            mock_decisions.return_value = "[]"
+
+            results = await main.batch_read(
+                workspace_id=workspace_id,
+                operations=[
+                    {"tool": "get_product_context"},
+                    {"tool": "get_decisions", "args": {"limit": 5}},
+                ],
+            )
+
+        assert [r["index"] for r in results] == [0, 1]
+        assert all(r["status"] == "success" for r in results)
+        assert results[0]["result"] == {"goal": "Test"}
+        assert results[1]["result"] == []
+
+    @pytest.mark.asyncio
+    async def test_unknown_tool_reports_error_entry(self, tmp_path):
+        """Non-read-only or unknown tool names become error entries."""
+        results = await main.batch_read(
+            workspace_id=str(tmp_path),
+            operations=[{"tool": "log_decision"}],
+        )
+
+        assert results[0]["status"] == "error"
+        assert "log_decision" in results[0]["result"]
+
+    @pytest.mark.asyncio
+    async def test_failing_operation_does_not_fail_batch(self, tmp_path):
+        """One raising operation is isolated from its siblings."""
+        workspace_id = str(tmp_path)
+        with patch(
+            'src.novaport_mcp.main.context_service.get_product_context'
+        ) as mock_ctx, patch(
+            'src.novaport_mcp.main.decision_service.get_multi_json'
+        ) as mock_decisions:
+            mock_context = Mock()
+            mock_context.content = {"goal": "Test"}
+            mock_ctx.return_value = mock_context
+            mock_decisions.side_effect = RuntimeError("boom")
+
+            results = await main.batch_read(
+                workspace_id=workspace_id,
+                operations=[
+                    {"tool": "get_product_context"},
+                    {"tool": "get_decisions"},
+                ],
+            )
+
+        assert results[0]["status"] == "success"
+        assert results[1]["status"] == "error"
+        assert "boom" in results[1]["result"]
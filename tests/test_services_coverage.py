@@ -87,48 +87,28 @@ class TestCustomDataServiceCoverage:
             mock_db_session.delete.assert_not_called()
             mock_db_session.commit.assert_not_called()
 
-    def test_upsert_create_new(self, mock_db_session, workspace_id):
-        """Test upsert when creating new record."""
+    def test_upsert_single_statement(self, mock_db_session, workspace_id):
+        """Test that upsert issues one ON CONFLICT statement and commits."""
         data = CustomDataCreate(
             category="test_category",
             key="test_key",
             value={"new": "data"}
         )
         
-        # Mock NoResultFound exception to simulate new record
-        mock_db_session.query.return_value.filter_by.return_value.one.side_effect = NoResultFound()
-        
-        with patch('src.novaport_mcp.services.vector_service.upsert_embedding') as mock_upsert_vector:
-            result = custom_data_service.upsert(mock_db_session, workspace_id, data)
-            
-            mock_db_session.add.assert_called_once()
-            mock_db_session.commit.assert_called_once()
-            mock_db_session.refresh.assert_called_once()
-            mock_upsert_vector.assert_called_once()
-
-    def test_upsert_update_existing(self, mock_db_session, workspace_id):
-        """Test upsert when updating existing record."""
-        data = CustomDataCreate(
-            category="test_category",
-            key="test_key",
-            value={"updated": "data"}
-        )
-        
-        mock_existing = Mock()
-        mock_existing.id = 1
-        mock_existing.category = "test_category"
-        mock_existing.key = "test_key"
-        mock_existing.value = {"updated": "data"}
-        
-        mock_db_session.query.return_value.filter_by.return_value.one.return_value = mock_existing
+        mock_row = Mock()
+        mock_row.id = 1
+        mock_row.category = "test_category"
+        mock_row.key = "test_key"
+        mock_row.value = {"new": "data"}
+        mock_db_session.execute.return_value.scalar_one.return_value = mock_row
         
         with patch('src.novaport_mcp.services.vector_service.upsert_embedding') as mock_upsert_vector:
-            result = custom_data_service.upsert(mock_db_session, workspace_id, data)
+            result = custom_data_service.upsert(mock_db_session, workspace_id, **data.model_dump())
             
-            assert mock_existing.value == {"updated": "data"}
-            mock_db_session.add.assert_not_called()
+            assert result == mock_row
+            mock_db_session.execute.assert_called_once()
             mock_db_session.commit.assert_called_once()
-            mock_db_session.refresh.assert_called_once()
+            mock_db_session.refresh.assert_not_called()
             mock_upsert_vector.assert_called_once()
 
     def test_upsert_serialization_error(self, mock_db_session, workspace_id):
@@ -139,16 +119,19 @@ class TestCustomDataServiceCoverage:
             value={"new": "data"}
         )
         
-        mock_db_session.query.return_value.filter_by.return_value.one.side_effect = NoResultFound()
+        mock_row = Mock()
+        mock_row.id = 1
+        mock_row.category = "test_category"
+        mock_row.key = "test_key"
+        mock_row.value = {"new": "data"}
+        mock_db_session.execute.return_value.scalar_one.return_value = mock_row
         
         with patch('src.novaport_mcp.services.vector_service.upsert_embedding') as mock_upsert_vector:
-            with patch('json.dumps', side_effect=TypeError("Cannot serialize")):
+            with patch('src.novaport_mcp.services.custom_data_service.orjson.dumps', side_effect=TypeError("Cannot serialize")):
                 with patch('src.novaport_mcp.services.custom_data_service.log') as mock_log:
-                    result = custom_data_service.upsert(mock_db_session, workspace_id, data)
+                    result = custom_data_service.upsert(mock_db_session, workspace_id, **data.model_dump())
                     
-                    mock_db_session.add.assert_called_once()
                     mock_db_session.commit.assert_called_once()
-                    mock_db_session.refresh.assert_called_once()
                     mock_upsert_vector.assert_not_called()
                     mock_log.warning.assert_called_once()
 
@@ -165,30 +148,33 @@ class TestCustomDataServiceCoverage:
     def test_search_fts_without_category(self, mock_db_session):
         """Test search_fts function without category filter."""
         mock_row1 = Mock()
-        mock_row1._mapping = {"id": 1, "category": "cat1", "key": "key1", "value": {"data": "value1"}}
+        mock_row1._mapping = {"id": 1, "category": "cat1", "key": "key1", "value": '{"data": "value1"}'}
         mock_row2 = Mock()
-        mock_row2._mapping = {"id": 2, "category": "cat2", "key": "key2", "value": {"data": "value2"}}
+        mock_row2._mapping = {"id": 2, "category": "cat2", "key": "key2", "value": '{"data": "value2"}'}
         
         mock_db_session.execute.return_value = [mock_row1, mock_row2]
         
-        with patch('src.novaport_mcp.db.models.CustomData') as mock_model:
-            result = custom_data_service.search_fts(mock_db_session, "test query", limit=5)
-            
-            mock_db_session.execute.assert_called_once()
-            assert mock_model.call_count == 2
+        result = custom_data_service.search_fts(mock_db_session, "test query", limit=5)
+        
+        mock_db_session.execute.assert_called_once()
+        assert len(result) == 2
+        # Raw FTS rows come back as Read models with the JSON value decoded.
+        assert result[0].value == {"data": "value1"}
+        assert result[1].key == "key2"
 
     def test_search_fts_with_category(self, mock_db_session):
         """Test search_fts function with category filter."""
         mock_row = Mock()
-        mock_row._mapping = {"id": 1, "category": "specific_cat", "key": "key1", "value": {"data": "value1"}}
+        mock_row._mapping = {"id": 1, "category": "specific_cat", "key": "key1", "value": '{"data": "value1"}'}
         
         mock_db_session.execute.return_value = [mock_row]
         
-        with patch('src.novaport_mcp.db.models.CustomData') as mock_model:
-            result = custom_data_service.search_fts(mock_db_session, "test query", category="specific_cat", limit=10)
-            
-            mock_db_session.execute.assert_called_once()
-            assert mock_model.call_count == 1
+        result = custom_data_service.search_fts(mock_db_session, "test query", category="specific_cat", limit=10)
+        
+        mock_db_session.execute.assert_called_once()
+        assert len(result) == 1
+        assert result[0].category == "specific_cat"
+        assert result[0].value == {"data": "value1"}
 
 
 class TestProgressServiceCoverage:
@@ -216,15 +202,17 @@ class TestProgressServiceCoverage:
             result = progress_service.create(
                 mock_db_session,
                 workspace_id,
-                entry_data,
+                **entry_data.model_dump(),
                 linked_item_type=None,
                 linked_item_id=None,
                 link_relationship_type="relates_to"
             )
             
             mock_db_session.add.assert_called_once()
+            mock_db_session.flush.assert_called_once()
             mock_db_session.commit.assert_called_once()
-            mock_db_session.refresh.assert_called_once()
+            # flush populates the PK; no post-commit refresh SELECT
+            mock_db_session.refresh.assert_not_called()
             mock_upsert.assert_called_once()
 
     def test_create_with_linking(self, mock_db_session, workspace_id):
@@ -239,7 +227,7 @@ class TestProgressServiceCoverage:
                 result = progress_service.create(
                     mock_db_session,
                     workspace_id,
-                    entry_data,
+                    **entry_data.model_dump(),
                     linked_item_type="decision",
                     linked_item_id="123",
                     link_relationship_type="implements"
@@ -371,9 +359,9 @@ class TestIOServiceCoverage:
 
         mock_export_path = MagicMock(spec=Path)
         
-        with patch('src.novaport_mcp.services.decision_service.get_multi') as mock_get_multi:
+        with patch('src.novaport_mcp.services.decision_service.iter_all') as mock_iter_all:
             with patch('builtins.open', mock_open()) as mock_file:
-                mock_get_multi.return_value = [mock_decision1, mock_decision2]
+                mock_iter_all.return_value = iter([mock_decision1, mock_decision2])
                 
                 result = io_service.export_to_markdown(mock_db_session, mock_export_path)
                 
@@ -386,8 +374,8 @@ class TestIOServiceCoverage:
         """Test export_to_markdown when no decisions exist."""
         mock_export_path = MagicMock(spec=Path)
         
-        with patch('src.novaport_mcp.services.decision_service.get_multi') as mock_get_multi:
-            mock_get_multi.return_value = []
+        with patch('src.novaport_mcp.services.decision_service.iter_all') as mock_iter_all:
+            mock_iter_all.return_value = iter([])
             
             result = io_service.export_to_markdown(mock_db_session, mock_export_path)
             
@@ -497,39 +485,36 @@ class TestMetaServiceCoverage:
 
     def test_get_recent_activity(self, mock_db_session):
         """Test get_recent_activity function."""
-        mock_decisions = [Mock(), Mock()]
         mock_progress = [Mock()]
-        mock_patterns = [Mock(), Mock(), Mock()]
-        
-        with patch('src.novaport_mcp.services.decision_service.get_multi') as mock_decision_multi:
-            with patch('src.novaport_mcp.services.progress_service.get_multi') as mock_progress_multi:
-                with patch('src.novaport_mcp.services.system_pattern_service.get_multi') as mock_pattern_multi:
-                    mock_decision_multi.return_value = mock_decisions
-                    mock_progress_multi.return_value = mock_progress
-                    mock_pattern_multi.return_value = mock_patterns
-                    
-                    result = meta_service.get_recent_activity(mock_db_session, limit=10)
-                    
-                    assert result["decisions"] == mock_decisions
-                    assert result["progress"] == mock_progress
-                    assert result["system_patterns"] == mock_patterns
-                    
-                    mock_decision_multi.assert_called_once_with(mock_db_session, limit=10, since=None)
-                    mock_progress_multi.assert_called_once_with(mock_db_session, limit=10, since=None)
-                    mock_pattern_multi.assert_called_once_with(mock_db_session, limit=10, since=None)
+        mock_db_session.execute.return_value = [
+            ("decision", '{"id": 1}'),
+            ("decision", '{"id": 2}'),
+            ("system_pattern", '{"id": 3}'),
+        ]
+
+        with patch('src.novaport_mcp.services.progress_service.get_multi') as mock_progress_multi:
+            mock_progress_multi.return_value = mock_progress
+
+            result = meta_service.get_recent_activity(mock_db_session, limit=10)
+
+            assert result["decisions"] == [{"id": 1}, {"id": 2}]
+            assert result["progress"] == mock_progress
+            assert result["system_patterns"] == [{"id": 3}]
+
+            mock_db_session.execute.assert_called_once()
+            mock_progress_multi.assert_called_once_with(mock_db_session, limit=10, since=None)
 
     def test_get_recent_activity_with_since(self, mock_db_session):
         """Test get_recent_activity function with since parameter."""
         since_date = datetime.datetime(2024, 1, 1)
-        
-        with patch('src.novaport_mcp.services.decision_service.get_multi') as mock_decision_multi:
-            with patch('src.novaport_mcp.services.progress_service.get_multi') as mock_progress_multi:
-                with patch('src.novaport_mcp.services.system_pattern_service.get_multi') as mock_pattern_multi:
-                    result = meta_service.get_recent_activity(mock_db_session, limit=5, since=since_date)
-                    
-                    mock_decision_multi.assert_called_once_with(mock_db_session, limit=5, since=since_date)
-                    mock_progress_multi.assert_called_once_with(mock_db_session, limit=5, since=since_date)
-                    mock_pattern_multi.assert_called_once_with(mock_db_session, limit=5, since=since_date)
+        mock_db_session.execute.return_value = []
+
+        with patch('src.novaport_mcp.services.progress_service.get_multi') as mock_progress_multi:
+            result = meta_service.get_recent_activity(mock_db_session, limit=5, since=since_date)
+
+            mock_db_session.execute.assert_called_once()
+            assert mock_db_session.execute.call_args[0][1] == {"limit": 5, "since": since_date}
+            mock_progress_multi.assert_called_once_with(mock_db_session, limit=5, since=since_date)
 
     def test_batch_log_items_decisions_success(self, mock_db_session, workspace_id):
         """Test batch_log_items for decisions with successful items."""
@@ -538,13 +523,22 @@ class TestMetaServiceCoverage:
             {"summary": "Decision 2", "rationale": "Rationale 2"}
         ]
         
-        with patch('src.novaport_mcp.services.decision_service.create') as mock_create:
+        mock_db_session.execute.return_value.scalars.return_value.all.return_value = [1, 2]
+
+        with patch('src.novaport_mcp.services.meta_service.vector_service.generate_embeddings_batch') as mock_encode, \
+             patch('src.novaport_mcp.services.meta_service.vector_service.upsert_embeddings_bulk') as mock_embed:
             result = meta_service.batch_log_items(mock_db_session, workspace_id, "decision", items)
-            
+
             assert result["succeeded"] == 2
             assert result["failed"] == 0
             assert result["details"] == []
-            assert mock_create.call_count == 2
+            mock_db_session.execute.assert_called_once()
+            mock_db_session.commit.assert_called_once()
+            # One batched encode, one bulk upsert with the encoded vectors
+            mock_encode.assert_called_once()
+            mock_embed.assert_called_once()
+            args = mock_embed.call_args[0]
+            assert args[1] == ["decision_1", "decision_2"]
 
     def test_batch_log_items_progress_success(self, mock_db_session, workspace_id):
         """Test batch_log_items for progress entries."""
@@ -553,13 +547,14 @@ class TestMetaServiceCoverage:
             {"status": "IN_PROGRESS", "description": "Task 2"}
         ]
         
-        with patch('src.novaport_mcp.services.progress_service.create') as mock_create:
+        with patch('src.novaport_mcp.services.progress_service.create_many') as mock_create_many:
             result = meta_service.batch_log_items(mock_db_session, workspace_id, "progress", items)
             
             assert result["succeeded"] == 2
             assert result["failed"] == 0
-            # Verify progress-specific kwargs were added
-            mock_create.assert_called()
+            # Both entries go through one batched service call
+            mock_create_many.assert_called_once()
+            assert len(mock_create_many.call_args.args[2]) == 2
 
     def test_batch_log_items_custom_data_success(self, mock_db_session, workspace_id):
         """Test batch_log_items for custom_data."""
@@ -568,12 +563,13 @@ class TestMetaServiceCoverage:
             {"category": "test", "key": "key2", "value": {"data": "value2"}}
         ]
         
-        with patch('src.novaport_mcp.services.custom_data_service.upsert') as mock_upsert:
+        with patch('src.novaport_mcp.services.custom_data_service.upsert_many') as mock_upsert_many:
             result = meta_service.batch_log_items(mock_db_session, workspace_id, "custom_data", items)
             
             assert result["succeeded"] == 2
             assert result["failed"] == 0
-            assert mock_upsert.call_count == 2
+            mock_upsert_many.assert_called_once()
+            assert len(mock_upsert_many.call_args.args[2]) == 2
 
     def test_batch_log_items_invalid_type(self, mock_db_session, workspace_id):
         """Test batch_log_items with invalid item_type."""
@@ -590,9 +586,12 @@ class TestMetaServiceCoverage:
             {"summary": "Another Valid Decision"}  # Valid
         ]
         
-        with patch('src.novaport_mcp.services.decision_service.create') as mock_create:
+        mock_db_session.execute.return_value.scalars.return_value.all.return_value = [1, 2]
+
+        with patch('src.novaport_mcp.services.meta_service.vector_service.generate_embeddings_batch'), \
+             patch('src.novaport_mcp.services.meta_service.vector_service.upsert_embeddings_bulk'):
             result = meta_service.batch_log_items(mock_db_session, workspace_id, "decision", items)
-            
+
             assert result["succeeded"] == 2
             assert result["failed"] == 1
             assert len(result["details"]) == 1
@@ -605,7 +604,10 @@ class TestLinkServiceCoverage:
     @pytest.fixture
     def mock_db_session(self):
         """Mock database session."""
-        return Mock(spec=Session)
+        mock_session = Mock(spec=Session)
+        # Real dict so the session-scoped get_for_item memo works.
+        mock_session.info = {}
+        return mock_session
 
     def test_create_link(self, mock_db_session):
         """Test create function."""
@@ -700,4 +702,65 @@ class TestSystemPatternServiceExtended:
         
         result = system_pattern_service.get_multi(mock_db_session, limit=10, since=since_date)
         
-        assert result == mock_patterns
\ No newline at end of file
+        assert result == mock_patterns
+
+class TestDecisionGetMultiJson:
+    """Tests for the SQL-side JSON aggregation read path."""
+
+    @pytest.fixture
+    def db_session(self):
+        """In-memory SQLite session with the real schema."""
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import sessionmaker
+        from src.novaport_mcp.db import models
+
+        engine = create_engine("sqlite://")
+        models.Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        yield session
+        session.close()
+
+    def _seed(self, db_session):
+        from src.novaport_mcp.db import models
+
+        db_session.add_all(
+            [
+                models.Decision(summary="Use Postgres", tags=["db", "infra"]),
+                models.Decision(summary="Use Redis", tags=["cache", "infra"]),
+                models.Decision(summary="Adopt ruff", tags=["tooling"]),
+            ]
+        )
+        db_session.commit()
+
+    def test_returns_all_rows_as_json(self, db_session):
+        """Without filters every decision comes back in one JSON document."""
+        self._seed(db_session)
+        rows = json.loads(decision_service.get_multi_json(db_session))
+        assert {r["summary"] for r in rows} == {
+            "Use Postgres",
+            "Use Redis",
+            "Adopt ruff",
+        }
+        assert all(isinstance(r["tags"], list) for r in rows)
+
+    def test_tags_all_requires_every_tag(self, db_session):
+        """tags_all only matches rows containing all requested tags."""
+        self._seed(db_session)
+        rows = json.loads(
+            decision_service.get_multi_json(db_session, tags_all=["db", "infra"])
+        )
+        assert [r["summary"] for r in rows] == ["Use Postgres"]
+
+    def test_tags_any_matches_any_tag(self, db_session):
+        """tags_any matches rows containing at least one requested tag."""
+        self._seed(db_session)
+        rows = json.loads(
+            decision_service.get_multi_json(
+                db_session, tags_any=["cache", "tooling"]
+            )
+        )
+        assert {r["summary"] for r in rows} == {"Use Redis", "Adopt ruff"}
+
+    def test_empty_table_returns_empty_array(self, db_session):
+        """An empty table yields the literal empty JSON array."""
+        assert decision_service.get_multi_json(db_session) == "[]"
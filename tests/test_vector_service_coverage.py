@@ -128,8 +128,9 @@ class TestVectorServiceChromaClient:
                         
                         vector_service.cleanup_chroma_client(workspace_id)
                         
-                        # Verify cleanup happened
-                        mock_collection.delete.assert_called_once_with(ids=["1", "2", "3"])
+                        # Verify cleanup happened; documents go with the
+                        # collection, no per-id delete round-trip
+                        mock_collection.delete.assert_not_called()
                         mock_client.delete_collection.assert_called_once_with(name="test_collection")
                         mock_client.reset.assert_called_once()
                         
@@ -184,21 +185,19 @@ class TestVectorServiceCollection:
         result = vector_service.get_collection(workspace_id, collection_name)
         
         assert result is mock_collection
-        mock_collection.count.assert_called_once()
+        # Cache hits are trusted; no count() validity round-trip
+        mock_collection.count.assert_not_called()
 
-    def test_get_collection_invalid_cache(self):
-        """Test get_collection met invalide cache."""
+    def test_get_collection_cache_evicted_by_cleanup(self):
+        """Test get_collection na cache-eviction door cleanup."""
         self.setUp()
         
         workspace_id = "test_workspace"
         collection_name = "test_collection"
         cache_key = f"{workspace_id}_{collection_name}"
         
-        # Mock invalid collection in cache
-        mock_invalid_collection = Mock()
-        mock_invalid_collection.count.side_effect = Exception("Invalid collection")
-        
-        vector_service._collections[cache_key] = mock_invalid_collection
+        # Cleanup removed the workspace's entries, so the cache is cold
+        assert cache_key not in vector_service._collections
         
         with patch('src.novaport_mcp.services.vector_service.get_chroma_client') as mock_get_client:
             mock_client = Mock()
@@ -209,8 +208,6 @@ class TestVectorServiceCollection:
             result = vector_service.get_collection(workspace_id, collection_name)
             
             assert result is mock_new_collection
-            # Should have removed invalid collection from cache
-            assert cache_key in vector_service._collections
             assert vector_service._collections[cache_key] is mock_new_collection
 
     def test_get_collection_create_new(self):
@@ -232,7 +229,14 @@ class TestVectorServiceCollection:
             
             assert result is mock_new_collection
             mock_client.get_collection.assert_called_once_with(name=collection_name)
-            mock_client.create_collection.assert_called_once_with(name=collection_name)
+            assert (
+                mock_client.create_collection.call_args.kwargs["name"]
+                == collection_name
+            )
+            # New collections carry the tuned HNSW configuration
+            config = mock_client.create_collection.call_args.kwargs["configuration"]
+            hnsw = config["hnsw"]
+            assert set(hnsw) == {"max_neighbors", "ef_construction", "ef_search"}
 
     def test_get_collection_error_handling(self):
         """Test get_collection error handling."""
@@ -326,6 +330,8 @@ class TestVectorServiceOperations:
                 }
                 mock_collection.query.return_value = mock_results
                 
+                # Query embeddings are memoized; start this test cold
+                vector_service._cached_query_embedding.cache_clear()
                 result = vector_service.search(workspace_id, query_text, top_k, filters)
                 
                 mock_get_collection.assert_called_once_with(workspace_id)
@@ -362,6 +368,8 @@ class TestVectorServiceOperations:
                 }
                 mock_collection.query.return_value = mock_results
                 
+                # Query embeddings are memoized; start this test cold
+                vector_service._cached_query_embedding.cache_clear()
                 result = vector_service.search(workspace_id, query_text, top_k)
                 
                 assert result == []
@@ -386,6 +394,8 @@ class TestVectorServiceOperations:
                 }
                 mock_collection.query.return_value = mock_results
                 
+                # Query embeddings are memoized; start this test cold
+                vector_service._cached_query_embedding.cache_clear()
                 result = vector_service.search(workspace_id, query_text, top_k)
                 
                 assert result == []